@@ -1,10 +1,7 @@
 
 # Binary Search on Answer
 
-def miniMax(nums, low, high):
-
-    def isMidValid(mid):
-        pass
+def miniMax(low, high, isMidValid):
 
     ans = high
     while low <= high:
@@ -19,10 +16,7 @@ def miniMax(nums, low, high):
 
     return ans
 
-def maxiMin(nums, low, high):
-
-    def isMidValid(mid):
-        pass
+def maxiMin(low, high, isMidValid):
 
     ans = low
     while low <= high:
@@ -40,19 +34,44 @@ def maxiMin(nums, low, high):
 # Trees
 
 def preorder(root):
-    if root == None:
-        return []
-    return [root.val] + preorder(root.left) + preorder(root.right)
+    res = []
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        res.append(node.val)
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+    return res
 
 def inorder(root):
-    if root == None:
-        return []
-    return inorder(root.left) + [root.val] + inorder(root.right)
+    res = []
+    stack = []
+    while stack or root:
+        while root:
+            stack.append(root)
+            root = root.left
+        root = stack.pop()
+        res.append(root.val)
+        root = root.right
+    return res
 
 def postorder(root):
-    if root == None:
-        return []
-    return preorder(root.left) + preorder(root.right) + [root.val]
+    res = []
+    stack = []
+    last = None
+    while stack or root:
+        while root:
+            stack.append(root)
+            root = root.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            root = top.right
+        else:
+            res.append(top.val)
+            last = stack.pop()
+    return res
 
 def morris(root):
 
@@ -349,6 +368,7 @@ def isBipartite(graph, n):
 
                     if color[nei] == -1:
                         color[nei] = 1 - color[node]
+                        queue.append(nei)
                     elif color[nei] == color[node]:
                         return False
 
@@ -169,4 +169,192 @@ def find_cycle_undirected_dfs(graph, n):
             if cycle:
                 return cycle
     
-    return []
\ No newline at end of file
+    return []
+
+def to_csr(graph, n):
+    start = [0] * (n + 1)
+    for u in range(n):
+        start[u + 1] = start[u] + len(graph[u])
+    
+    adj = [0] * start[n]
+    for u in range(n):
+        adj[start[u]:start[u + 1]] = graph[u]
+    
+    return start, adj
+
+def has_cycle_directed_iterative(graph, n):
+    start, adj = to_csr(graph, n)
+    color = bytearray(n)
+    ptr = start[:n]
+    
+    for s in range(n):
+        if color[s]:
+            continue
+        
+        color[s] = 1
+        stack = [s]
+        
+        while stack:
+            u = stack[-1]
+            
+            if ptr[u] < start[u + 1]:
+                v = adj[ptr[u]]
+                ptr[u] += 1
+                
+                if color[v] == 1:
+                    return True
+                if color[v] == 0:
+                    color[v] = 1
+                    stack.append(v)
+            else:
+                color[u] = 2
+                stack.pop()
+    
+    return False
+
+def find_cycle_directed_iterative(graph, n):
+    start, adj = to_csr(graph, n)
+    color = bytearray(n)
+    ptr = start[:n]
+    pos = [0] * n
+    
+    for s in range(n):
+        if color[s]:
+            continue
+        
+        color[s] = 1
+        stack = [s]
+        
+        while stack:
+            u = stack[-1]
+            
+            if ptr[u] < start[u + 1]:
+                v = adj[ptr[u]]
+                ptr[u] += 1
+                
+                if color[v] == 1:
+                    return stack[pos[v]:]
+                if color[v] == 0:
+                    color[v] = 1
+                    pos[v] = len(stack)
+                    stack.append(v)
+            else:
+                color[u] = 2
+                stack.pop()
+    
+    return []
+
+def find_cycle_undirected_iterative(graph, n):
+    start, adj = to_csr(graph, n)
+    color = bytearray(n)
+    parent = [-1] * n
+    ptr = start[:n]
+    pos = [0] * n
+    
+    for s in range(n):
+        if color[s]:
+            continue
+        
+        color[s] = 1
+        stack = [s]
+        
+        while stack:
+            u = stack[-1]
+            
+            if ptr[u] < start[u + 1]:
+                v = adj[ptr[u]]
+                ptr[u] += 1
+                
+                if v == parent[u]:
+                    parent[u] = -1      # skip one copy of the tree edge only
+                elif color[v] == 0:
+                    color[v] = 1
+                    parent[v] = u
+                    pos[v] = len(stack)
+                    stack.append(v)
+                elif color[v] == 1:
+                    return stack[pos[v]:]
+            else:
+                color[u] = 2
+                stack.pop()
+    
+    return []
+
+def has_cycle_undirected_iterative(graph, n):
+    return len(find_cycle_undirected_iterative(graph, n)) > 0
+
+def shortest_cycle(graph, n, directed=False):
+    start, adj = to_csr(graph, n)
+    dist = [-1] * n
+    parent = [-1] * n
+    best = n + 1
+    best_cycle = []
+    
+    for s in range(n):
+        dist[s] = 0
+        touched = [s]
+        head = 0
+        found = False
+        
+        while head < len(touched) and not found:
+            u = touched[head]
+            head += 1
+            du = dist[u]
+            skip = parent[u]
+            
+            if (du + 1 if directed else 2 * du) >= best:
+                break
+            
+            for i in range(start[u], start[u + 1]):
+                v = adj[i]
+                
+                if v == u:
+                    best, best_cycle = 1, [u]
+                    found = True
+                    break
+                
+                if directed:
+                    if v == s:
+                        best = du + 1
+                        best_cycle = []
+                        while u != -1:
+                            best_cycle.append(u)
+                            u = parent[u]
+                        best_cycle.reverse()
+                        found = True
+                        break
+                elif v == skip:
+                    skip = -1
+                    continue
+                elif dist[v] != -1 and parent[v] == u:
+                    if best > 2:
+                        best, best_cycle = 2, [u, v]
+                    continue
+                elif dist[v] != -1:
+                    length = du + dist[v] + 1
+                    if length < best:
+                        best = length
+                        left, right = [], []
+                        a, b = u, v
+                        while a != -1:
+                            left.append(a)
+                            a = parent[a]
+                        while b != s:
+                            right.append(b)
+                            b = parent[b]
+                        best_cycle = left[::-1] + right
+                    continue
+                
+                if dist[v] == -1:
+                    dist[v] = du + 1
+                    parent[v] = u
+                    touched.append(v)
+        
+        for u in touched:
+            dist[u] = -1
+            parent[u] = -1
+        
+        if best == 1:
+            break
+    
+    return best_cycle
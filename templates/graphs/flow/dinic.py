@@ -0,0 +1,115 @@
+class Dinic:
+    def __init__(self, n):
+        self.n = n
+        self.head = [-1] * n
+        self.to = []
+        self.cap = []
+        self.nxt = []
+        self.orig = []
+    
+    def add_edge(self, u, v, cap, rcap=0):
+        e = len(self.to)
+        
+        self.to.append(v)
+        self.cap.append(cap)
+        self.nxt.append(self.head[u])
+        self.head[u] = e
+        
+        self.to.append(u)
+        self.cap.append(rcap)
+        self.nxt.append(self.head[v])
+        self.head[v] = e + 1
+        
+        self.orig.append(cap)
+        self.orig.append(rcap)
+        return e
+    
+    def bfs(self, s, t):
+        to, cap, nxt, head = self.to, self.cap, self.nxt, self.head
+        level = [-1] * self.n
+        level[s] = 0
+        queue = [s]
+        
+        for u in queue:
+            e = head[u]
+            while e != -1:
+                v = to[e]
+                if cap[e] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+                e = nxt[e]
+        
+        self.level = level
+        return level[t] >= 0
+    
+    def blocking_flow(self, s, t):
+        to, cap, nxt, level = self.to, self.cap, self.nxt, self.level
+        it = self.head[:]
+        path = []
+        total = 0
+        u = s
+        
+        while True:
+            if u == t:
+                f = min(cap[e] for e in path)
+                cut = len(path)
+                
+                for i, e in enumerate(path):
+                    cap[e] -= f
+                    cap[e ^ 1] += f
+                    if cap[e] == 0 and cut == len(path):
+                        cut = i
+                
+                total += f
+                del path[cut:]
+                u = to[path[-1]] if path else s
+                continue
+            
+            e = it[u]
+            while e != -1 and (cap[e] == 0 or level[to[e]] != level[u] + 1):
+                e = nxt[e]
+            it[u] = e
+            
+            if e != -1:
+                path.append(e)
+                u = to[e]
+                continue
+            
+            if u == s:
+                break
+            
+            level[u] = -1
+            e = path.pop()
+            u = to[e ^ 1]
+            it[u] = nxt[it[u]]
+        
+        return total
+    
+    def max_flow(self, s, t):
+        flow = 0
+        while self.bfs(s, t):
+            flow += self.blocking_flow(s, t)
+        return flow
+    
+    def min_cut(self, s):
+        to, cap, nxt, head = self.to, self.cap, self.nxt, self.head
+        seen = bytearray(self.n)
+        seen[s] = 1
+        queue = [s]
+        
+        for u in queue:
+            e = head[u]
+            while e != -1:
+                v = to[e]
+                if cap[e] > 0 and not seen[v]:
+                    seen[v] = 1
+                    queue.append(v)
+                e = nxt[e]
+        
+        cut = [(to[e ^ 1], to[e], e) for e in range(0, len(to), 2)
+               if seen[to[e ^ 1]] and not seen[to[e]]]
+        
+        return queue, cut
+    
+    def flow_on(self, e):
+        return self.orig[e] - self.cap[e]
@@ -0,0 +1,112 @@
+import heapq
+
+class MinCostFlow:
+    def __init__(self, n):
+        self.n = n
+        self.head = [-1] * n
+        self.to = []
+        self.cap = []
+        self.cost = []
+        self.nxt = []
+    
+    def add_edge(self, u, v, cap, cost):
+        e = len(self.to)
+        
+        self.to.append(v)
+        self.cap.append(cap)
+        self.cost.append(cost)
+        self.nxt.append(self.head[u])
+        self.head[u] = e
+        
+        self.to.append(u)
+        self.cap.append(0)
+        self.cost.append(-cost)
+        self.nxt.append(self.head[v])
+        self.head[v] = e + 1
+        
+        return e
+    
+    def bellman_ford(self, s):
+        to, cap, cost, nxt, head = self.to, self.cap, self.cost, self.nxt, self.head
+        inf = float('inf')
+        dist = [inf] * self.n
+        dist[s] = 0
+        
+        for _ in range(self.n - 1):
+            updated = False
+            for u in range(self.n):
+                if dist[u] == inf:
+                    continue
+                e = head[u]
+                while e != -1:
+                    if cap[e] > 0 and dist[u] + cost[e] < dist[to[e]]:
+                        dist[to[e]] = dist[u] + cost[e]
+                        updated = True
+                    e = nxt[e]
+            if not updated:
+                break
+        
+        return [d if d != inf else 0 for d in dist]
+    
+    def dijkstra(self, s, pot):
+        to, cap, cost, nxt, head = self.to, self.cap, self.cost, self.nxt, self.head
+        inf = float('inf')
+        dist = [inf] * self.n
+        prev = [-1] * self.n
+        dist[s] = 0
+        pq = [(0, s)]
+        
+        while pq:
+            d, u = heapq.heappop(pq)
+            
+            if d > dist[u]:
+                continue
+            
+            pu = pot[u]
+            e = head[u]
+            while e != -1:
+                if cap[e] > 0:
+                    v = to[e]
+                    nd = d + cost[e] + pu - pot[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        prev[v] = e
+                        heapq.heappush(pq, (nd, v))
+                e = nxt[e]
+        
+        return dist, prev
+    
+    def flow(self, s, t, max_flow=float('inf'), negative_costs=False):
+        to, cap = self.to, self.cap
+        inf = float('inf')
+        pot = self.bellman_ford(s) if negative_costs else [0] * self.n
+        flow = cost = 0
+        
+        while flow < max_flow:
+            dist, prev = self.dijkstra(s, pot)
+            
+            if dist[t] == inf:
+                break
+            
+            for v in range(self.n):
+                if dist[v] != inf:
+                    pot[v] += dist[v]
+            
+            f = max_flow - flow
+            v = t
+            while v != s:
+                e = prev[v]
+                f = min(f, cap[e])
+                v = to[e ^ 1]
+            
+            v = t
+            while v != s:
+                e = prev[v]
+                cap[e] -= f
+                cap[e ^ 1] += f
+                v = to[e ^ 1]
+            
+            flow += f
+            cost += f * (pot[t] - pot[s])
+        
+        return flow, cost
@@ -30,4 +30,76 @@ class AdjacencyList:
     def print_graph(self):
         for vertex in sorted(self.graph.keys()):
             neighbors = [f"{v}({w})" for v, w in self.graph[vertex]]
-            print(f"{vertex}: {neighbors}")
\ No newline at end of file
+            print(f"{vertex}: {neighbors}")
+
+class IndexedAdjacencyList:
+    def __init__(self, directed=False):
+        self.graph = defaultdict(list)
+        self.index = defaultdict(dict)
+        self.vertices = set()
+        self.directed = directed
+    
+    def link(self, u, v, weight):
+        slot = self.index[u].get(v)
+        if slot is None:
+            self.index[u][v] = len(self.graph[u])
+            self.graph[u].append((v, weight))
+        else:
+            self.graph[u][slot] = (v, weight)
+    
+    def unlink(self, u, v):
+        slot = self.index[u].pop(v, None)
+        if slot is None:
+            return
+        
+        neighbors = self.graph[u]
+        last = neighbors.pop()
+        if slot < len(neighbors):
+            neighbors[slot] = last
+            self.index[u][last[0]] = slot
+    
+    def add_edge(self, u, v, weight=1):
+        self.vertices.add(u)
+        self.vertices.add(v)
+        self.link(u, v, weight)
+        if not self.directed:
+            self.link(v, u, weight)
+    
+    def remove_edge(self, u, v):
+        self.unlink(u, v)
+        if not self.directed:
+            self.unlink(v, u)
+    
+    def get_neighbors(self, u):
+        return self.graph[u]
+    
+    def has_edge(self, u, v):
+        return v in self.index[u]
+    
+    def get_weight(self, u, v):
+        slot = self.index[u].get(v)
+        return None if slot is None else self.graph[u][slot][1]
+    
+    def get_vertices(self):
+        return list(self.vertices)
+    
+    def freeze(self, n):
+        start = [0] * (n + 1)
+        for u in range(n):
+            start[u + 1] = start[u] + len(self.graph.get(u, ()))
+        
+        adj = [0] * start[n]
+        weight = [0] * start[n]
+        for u in range(n):
+            i = start[u]
+            for v, w in self.graph.get(u, ()):
+                adj[i] = v
+                weight[i] = w
+                i += 1
+        
+        return start, adj, weight
+    
+    def print_graph(self):
+        for vertex in sorted(self.graph.keys()):
+            neighbors = [f"{v}({w})" for v, w in self.graph[vertex]]
+            print(f"{vertex}: {neighbors}")
@@ -1,3 +1,5 @@
+from array import array
+
 class AdjacencyMatrix:
     def __init__(self, num_vertices, directed=False):
         self.num_vertices = num_vertices
@@ -34,4 +36,122 @@ class AdjacencyMatrix:
     
     def print_matrix(self):
         for row in self.matrix:
-            print(row)
\ No newline at end of file
+            print(row)
+
+def bits(mask):
+    s = bin(mask)[:1:-1]
+    res = []
+    i = s.find("1")
+    while i != -1:
+        res.append(i)
+        i = s.find("1", i + 1)
+    return res
+
+class BitsetAdjacencyMatrix:
+    def __init__(self, num_vertices, directed=False):
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.rows = [0] * num_vertices
+    
+    def add_edge(self, u, v):
+        if 0 <= u < self.num_vertices and 0 <= v < self.num_vertices:
+            self.rows[u] |= 1 << v
+            if not self.directed:
+                self.rows[v] |= 1 << u
+    
+    def remove_edge(self, u, v):
+        if 0 <= u < self.num_vertices and 0 <= v < self.num_vertices:
+            self.rows[u] &= ~(1 << v)
+            if not self.directed:
+                self.rows[v] &= ~(1 << u)
+    
+    def has_edge(self, u, v):
+        if 0 <= u < self.num_vertices and 0 <= v < self.num_vertices:
+            return self.rows[u] >> v & 1 == 1
+        return False
+    
+    def get_neighbors(self, u):
+        if 0 <= u < self.num_vertices:
+            return bits(self.rows[u])
+        return []
+    
+    def degree(self, u):
+        return self.rows[u].bit_count()
+    
+    def common_neighbors(self, u, v):
+        return bits(self.rows[u] & self.rows[v])
+    
+    def count_triangles(self):
+        rows = self.rows
+        total = 0
+        
+        for u in range(self.num_vertices):
+            for v in bits(rows[u] >> (u + 1)):
+                v += u + 1
+                total += ((rows[u] & rows[v]) >> (v + 1)).bit_count()
+        
+        return total
+    
+    def bfs(self, sources):
+        rows = self.rows
+        level = [-1] * self.num_vertices
+        frontier = 0
+        
+        for s in sources:
+            frontier |= 1 << s
+        
+        visited = frontier
+        depth = 0
+        
+        while frontier:
+            nxt = 0
+            for u in bits(frontier):
+                level[u] = depth
+                nxt |= rows[u]
+            
+            frontier = nxt & ~visited
+            visited |= frontier
+            depth += 1
+        
+        return level
+    
+    def print_matrix(self):
+        for row in self.rows:
+            print(format(row, "0%db" % self.num_vertices)[::-1] if self.num_vertices else "")
+
+class FlatAdjacencyMatrix:
+    def __init__(self, num_vertices, directed=False, typecode="i"):
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.matrix = array(typecode, [0]) * (num_vertices * num_vertices)
+    
+    def add_edge(self, u, v, weight=1):
+        n = self.num_vertices
+        if 0 <= u < n and 0 <= v < n:
+            self.matrix[u * n + v] = weight
+            if not self.directed:
+                self.matrix[v * n + u] = weight
+    
+    def remove_edge(self, u, v):
+        self.add_edge(u, v, 0)
+    
+    def get_neighbors(self, u):
+        n = self.num_vertices
+        if 0 <= u < n:
+            row = self.matrix[u * n:(u + 1) * n]
+            return [(v, w) for v, w in enumerate(row) if w]
+        return []
+    
+    def has_edge(self, u, v):
+        return self.get_weight(u, v) != 0
+    
+    def get_weight(self, u, v):
+        n = self.num_vertices
+        if 0 <= u < n and 0 <= v < n:
+            return self.matrix[u * n + v]
+        return 0
+    
+    def print_matrix(self):
+        n = self.num_vertices
+        for u in range(n):
+            print(self.matrix[u * n:(u + 1) * n].tolist())
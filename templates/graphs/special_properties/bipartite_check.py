@@ -74,4 +74,62 @@ def is_bipartite_union_find(edges, n):
         uf.union(u, v + n)
         uf.union(u + n, v)
     
-    return True
\ No newline at end of file
+    return True
+
+def to_csr(graph, n):
+    start = [0] * (n + 1)
+    for u in range(n):
+        start[u + 1] = start[u] + len(graph[u])
+    
+    adj = [0] * start[n]
+    for u in range(n):
+        adj[start[u]:start[u + 1]] = graph[u]
+    
+    return start, adj
+
+def bipartition_csr(start, adj, n):
+    color = [-1] * n
+    parent = [-1] * n
+    order = [0] * n
+    tail = 0
+    
+    for s in range(n):
+        if color[s] != -1:
+            continue
+        
+        color[s] = 0
+        order[tail] = s
+        head = tail
+        tail += 1
+        
+        while head < tail:
+            u = order[head]
+            head += 1
+            cu = color[u]
+            
+            for i in range(start[u], start[u + 1]):
+                v = adj[i]
+                
+                if color[v] == -1:
+                    color[v] = cu ^ 1
+                    parent[v] = u
+                    order[tail] = v
+                    tail += 1
+                elif color[v] == cu:
+                    left, right = [u], [v]
+                    while u != v:
+                        u, v = parent[u], parent[v]
+                        left.append(u)
+                        right.append(v)
+                    right.pop()
+                    return None, left + right[::-1]
+    
+    sides = ([], [])
+    for u in range(n):
+        sides[color[u]].append(u)
+    
+    return sides, []
+
+def bipartition(graph, n):
+    start, adj = to_csr(graph, n)
+    return bipartition_csr(start, adj, n)
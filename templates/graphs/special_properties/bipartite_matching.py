@@ -0,0 +1,138 @@
+def edges_to_csr(edges, n_left):
+    start = [0] * (n_left + 1)
+    for u, _ in edges:
+        start[u + 1] += 1
+    
+    for u in range(n_left):
+        start[u + 1] += start[u]
+    
+    adj = [0] * len(edges)
+    pos = start[:n_left]
+    for u, v in edges:
+        adj[pos[u]] = v
+        pos[u] += 1
+    
+    return start, adj
+
+def hopcroft_karp(start, adj, n_left, n_right):
+    match_l = [-1] * n_left
+    match_r = [-1] * n_right
+    dist = [-1] * n_left
+    size = 0
+    
+    for u in range(n_left):
+        for i in range(start[u], start[u + 1]):
+            v = adj[i]
+            if match_r[v] == -1:
+                match_l[u] = v
+                match_r[v] = u
+                size += 1
+                break
+    
+    while True:
+        queue = []
+        for u in range(n_left):
+            if match_l[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+            else:
+                dist[u] = -1
+        
+        found = False
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            
+            for i in range(start[u], start[u + 1]):
+                w = match_r[adj[i]]
+                if w == -1:
+                    found = True
+                elif dist[w] == -1 and not found:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        
+        if not found:
+            break
+        
+        it = start[:n_left]
+        
+        for s in range(n_left):
+            if match_l[s] != -1:
+                continue
+            
+            stack = [s]
+            while stack:
+                u = stack[-1]
+                
+                if it[u] == start[u + 1]:
+                    dist[u] = -1
+                    stack.pop()
+                    continue
+                
+                w = match_r[adj[it[u]]]
+                
+                if w == -1:
+                    for x in stack:
+                        y = adj[it[x]]
+                        match_l[x] = y
+                        match_r[y] = x
+                        dist[x] = -1
+                    size += 1
+                    break
+                
+                if dist[w] == dist[u] + 1:
+                    stack.append(w)
+                else:
+                    it[u] += 1
+    
+    return size, match_l, match_r
+
+def min_vertex_cover(start, adj, n_left, n_right, match_l, match_r):
+    seen_l = bytearray(n_left)
+    seen_r = bytearray(n_right)
+    
+    queue = [u for u in range(n_left) if match_l[u] == -1]
+    for u in queue:
+        seen_l[u] = 1
+    
+    head = 0
+    while head < len(queue):
+        u = queue[head]
+        head += 1
+        
+        for i in range(start[u], start[u + 1]):
+            v = adj[i]
+            if seen_r[v]:
+                continue
+            
+            seen_r[v] = 1
+            w = match_r[v]
+            if w != -1 and not seen_l[w]:
+                seen_l[w] = 1
+                queue.append(w)
+    
+    cover_left = [u for u in range(n_left) if not seen_l[u]]
+    cover_right = [v for v in range(n_right) if seen_r[v]]
+    
+    return cover_left, cover_right
+
+def maximum_matching(graph, n, sides):
+    left, right = sides
+    idx = [0] * n
+    
+    for i, u in enumerate(left):
+        idx[u] = i
+    for i, v in enumerate(right):
+        idx[v] = i
+    
+    edges = [(i, idx[v]) for i, u in enumerate(left) for v in graph[u]]
+    start, adj = edges_to_csr(edges, len(left))
+    
+    _, match_l, match_r = hopcroft_karp(start, adj, len(left), len(right))
+    cover_left, cover_right = min_vertex_cover(start, adj, len(left), len(right), match_l, match_r)
+    
+    matching = [(left[i], right[j]) for i, j in enumerate(match_l) if j != -1]
+    cover = [left[i] for i in cover_left] + [right[j] for j in cover_right]
+    
+    return matching, cover
@@ -1,3 +1,4 @@
+import heapq
 from collections import deque, defaultdict
 
 def topological_sort_kahn(graph, n):
@@ -67,7 +68,154 @@ def has_cycle_dfs(graph, n):
     
     return False
 
+def to_csr(graph, n):
+    start = [0] * (n + 1)
+    for u in range(n):
+        start[u + 1] = start[u] + len(graph[u])
+    
+    adj = [0] * start[n]
+    for u in range(n):
+        adj[start[u]:start[u + 1]] = graph[u]
+    
+    return start, adj
+
+def topological_sort(graph, n, mode="fifo"):
+    start, adj = to_csr(graph, n)
+    indegree = [0] * n
+    
+    for v in adj:
+        indegree[v] += 1
+    
+    order = [i for i in range(n) if indegree[i] == 0]
+    
+    if mode == "lex":
+        heapq.heapify(order)
+        heap = order
+        order = []
+        
+        while heap:
+            u = heapq.heappop(heap)
+            order.append(u)
+            
+            for i in range(start[u], start[u + 1]):
+                v = adj[i]
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    heapq.heappush(heap, v)
+        
+        return order, len(order) != n
+    
+    if mode == "layers":
+        layers = []
+        layer = order
+        processed = 0
+        
+        while layer:
+            layers.append(layer)
+            processed += len(layer)
+            nxt = []
+            
+            for u in layer:
+                for i in range(start[u], start[u + 1]):
+                    v = adj[i]
+                    indegree[v] -= 1
+                    if indegree[v] == 0:
+                        nxt.append(v)
+            
+            layer = nxt
+        
+        return layers, processed != n
+    
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        
+        for i in range(start[u], start[u + 1]):
+            v = adj[i]
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                order.append(v)
+    
+    return order, len(order) != n
+
 def topological_sort_with_cycle_check(graph, n):
-    if has_cycle_dfs(graph, n):
-        return []
-    return topological_sort_dfs(graph, n)
\ No newline at end of file
+    order, has_cycle = topological_sort(graph, n)
+    return [] if has_cycle else order
+
+class DynamicTopologicalOrder:
+    def __init__(self, n):
+        self.n = n
+        self.graph = [[] for _ in range(n)]
+        self.rgraph = [[] for _ in range(n)]
+        self.ord = list(range(n))
+        self.node = list(range(n))
+        self.seen = [0] * n
+        self.stamp = 0
+    
+    def forward(self, src, ub):
+        ord, seen, stamp = self.ord, self.seen, self.stamp
+        seen[src] = stamp
+        stack = [src]
+        visited = []
+        
+        while stack:
+            u = stack.pop()
+            visited.append(u)
+            
+            for v in self.graph[u]:
+                if ord[v] == ub:
+                    return None
+                if seen[v] != stamp and ord[v] < ub:
+                    seen[v] = stamp
+                    stack.append(v)
+        
+        return visited
+    
+    def backward(self, src, lb):
+        ord, seen, stamp = self.ord, self.seen, self.stamp
+        seen[src] = stamp
+        stack = [src]
+        visited = []
+        
+        while stack:
+            u = stack.pop()
+            visited.append(u)
+            
+            for v in self.rgraph[u]:
+                if seen[v] != stamp and ord[v] > lb:
+                    seen[v] = stamp
+                    stack.append(v)
+        
+        return visited
+    
+    def add_edge(self, u, v):
+        if u == v:
+            return False
+        
+        ord = self.ord
+        lb, ub = ord[v], ord[u]
+        
+        if lb < ub:
+            self.stamp += 1
+            delta_f = self.forward(v, ub)
+            if delta_f is None:
+                return False
+            
+            delta_b = self.backward(u, lb)
+            delta_b.sort(key=ord.__getitem__)
+            delta_f.sort(key=ord.__getitem__)
+            
+            nodes = delta_b + delta_f
+            slots = sorted(ord[w] for w in nodes)
+            
+            for w, i in zip(nodes, slots):
+                ord[w] = i
+                self.node[i] = w
+        
+        self.graph[u].append(v)
+        self.rgraph[v].append(u)
+        return True
+    
+    def order(self):
+        return self.node[:]
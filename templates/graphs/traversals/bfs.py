@@ -0,0 +1,117 @@
+def to_csr(graph, n):
+    start = [0] * (n + 1)
+    for u in range(n):
+        start[u + 1] = start[u] + len(graph[u])
+    
+    adj = [0] * start[n]
+    for u in range(n):
+        adj[start[u]:start[u + 1]] = graph[u]
+    
+    return start, adj
+
+def reverse_csr(start, adj, n):
+    rstart = [0] * (n + 1)
+    for v in adj:
+        rstart[v + 1] += 1
+    
+    for v in range(n):
+        rstart[v + 1] += rstart[v]
+    
+    radj = [0] * len(adj)
+    pos = rstart[:n]
+    for u in range(n):
+        for i in range(start[u], start[u + 1]):
+            v = adj[i]
+            radj[pos[v]] = u
+            pos[v] += 1
+    
+    return rstart, radj
+
+def bfs_levels(graph, n, sources):
+    start, adj = to_csr(graph, n)
+    level = [-1] * n
+    frontier = []
+    
+    for s in sources:
+        if level[s] < 0:
+            level[s] = 0
+            frontier.append(s)
+    
+    depth = 0
+    while frontier:
+        depth += 1
+        nxt = []
+        for u in frontier:
+            for i in range(start[u], start[u + 1]):
+                v = adj[i]
+                if level[v] < 0:
+                    level[v] = depth
+                    nxt.append(v)
+        frontier = nxt
+    
+    return level
+
+def direction_optimizing_bfs(graph, n, sources, directed=False, alpha=14, beta=24):
+    start, adj = to_csr(graph, n)
+    rstart, radj = reverse_csr(start, adj, n) if directed else (start, adj)
+    
+    level = [-1] * n
+    in_frontier = bytearray(n)
+    frontier = []
+    
+    for s in sources:
+        if level[s] < 0:
+            level[s] = 0
+            in_frontier[s] = 1
+            frontier.append(s)
+    
+    edges_unvisited = len(adj) - sum(start[u + 1] - start[u] for u in frontier)
+    unvisited = None
+    top_down = True
+    depth = 0
+    
+    while frontier:
+        depth += 1
+        
+        if top_down:
+            edges_frontier = 0
+            for u in frontier:
+                edges_frontier += start[u + 1] - start[u]
+            if edges_frontier > edges_unvisited // alpha:
+                top_down = False
+                unvisited = [v for v in range(n) if level[v] < 0]
+        elif len(frontier) < n // beta:
+            top_down = True
+        
+        nxt = []
+        
+        if top_down:
+            for u in frontier:
+                for i in range(start[u], start[u + 1]):
+                    v = adj[i]
+                    if level[v] < 0:
+                        level[v] = depth
+                        nxt.append(v)
+        else:
+            still = []
+            for v in unvisited:
+                if level[v] >= 0:
+                    continue
+                for i in range(rstart[v], rstart[v + 1]):
+                    if in_frontier[radj[i]]:
+                        level[v] = depth
+                        nxt.append(v)
+                        break
+                else:
+                    still.append(v)
+            unvisited = still
+        
+        for u in frontier:
+            in_frontier[u] = 0
+        for v in nxt:
+            in_frontier[v] = 1
+            edges_unvisited -= start[v + 1] - start[v]
+        
+        frontier = nxt
+    
+    return level
@@ -0,0 +1,88 @@
+def first_true(low, high, pred):
+    ans = high + 1
+    while low <= high:
+        mid = (low + high) // 2
+        if pred(mid):
+            ans = mid
+            high = mid - 1
+        else:
+            low = mid + 1
+    return ans
+
+def last_true(low, high, pred):
+    ans = low - 1
+    while low <= high:
+        mid = (low + high) // 2
+        if pred(mid):
+            ans = mid
+            low = mid + 1
+        else:
+            high = mid - 1
+    return ans
+
+def first_true_real(low, high, pred, iterations=100):
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        if pred(mid):
+            high = mid
+        else:
+            low = mid
+    return high
+
+def last_true_real(low, high, pred, iterations=100):
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        if pred(mid):
+            low = mid
+        else:
+            high = mid
+    return low
+
+def gallop_first_true(low, pred):
+    if pred(low):
+        return low
+    
+    step = 1
+    while not pred(low + step):
+        low += step
+        step *= 2
+    
+    return first_true(low + 1, low + step, pred)
+
+def memoize(pred):
+    cache = {}
+    
+    def wrapper(x):
+        if x not in cache:
+            cache[x] = pred(x)
+        return cache[x]
+    
+    wrapper.cache = cache
+    return wrapper
+
+def parallel_binary_search(q, low, high, reset, apply, check):
+    lo = [low] * q
+    hi = [high + 1] * q
+    
+    while True:
+        buckets = [[] for _ in range(high - low + 1)]
+        active = False
+        
+        for i in range(q):
+            if lo[i] < hi[i]:
+                buckets[(lo[i] + hi[i]) // 2 - low].append(i)
+                active = True
+        
+        if not active:
+            break
+        
+        reset()
+        for t in range(low, high + 1):
+            apply(t)
+            for i in buckets[t - low]:
+                if check(i):
+                    hi[i] = t
+                else:
+                    lo[i] = t + 1
+    
+    return lo
@@ -121,4 +121,353 @@ def deleteNode(root, key):
         root.right = rightRotate(root.right)
         return leftRotate(root)
 
-    return root
\ No newline at end of file
+    return root
+
+def rebalance(root):
+    root.height = 1 + max(height(root.left), height(root.right))
+    balance = getBalance(root)
+
+    if balance > 1:
+        if getBalance(root.left) < 0:
+            root.left = leftRotate(root.left)
+        return rightRotate(root)
+
+    if balance < -1:
+        if getBalance(root.right) > 0:
+            root.right = rightRotate(root.right)
+        return leftRotate(root)
+
+    return root
+
+def buildFromSorted(keys, lo=0, hi=None):
+    if hi is None:
+        hi = len(keys)
+    if lo >= hi:
+        return None
+
+    mid = (lo + hi) // 2
+    root = Node(keys[mid])
+    root.left = buildFromSorted(keys, lo, mid)
+    root.right = buildFromSorted(keys, mid + 1, hi)
+    root.height = 1 + max(height(root.left), height(root.right))
+    return root
+
+def join(left, mid, right):
+    hl, hr = height(left), height(right)
+
+    if hl > hr + 1:
+        left.right = join(left.right, mid, right)
+        return rebalance(left)
+
+    if hr > hl + 1:
+        right.left = join(left, mid, right.left)
+        return rebalance(right)
+
+    mid.left = left
+    mid.right = right
+    mid.height = 1 + max(hl, hr)
+    return mid
+
+def joinKey(left, key, right):
+    return join(left, Node(key), right)
+
+def split(root, key):
+    if root is None:
+        return None, False, None
+
+    left, right = root.left, root.right
+
+    if key < root.val:
+        l, found, r = split(left, key)
+        return l, found, join(r, root, right)
+
+    if key > root.val:
+        l, found, r = split(right, key)
+        return join(left, root, l), found, r
+
+    return left, True, right
+
+def popMax(root):
+    if root.right is None:
+        return root.left, root
+
+    root.right, node = popMax(root.right)
+    return rebalance(root), node
+
+def concat(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    left, node = popMax(left)
+    return join(left, node, right)
+
+def union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+
+    l, _, r = split(b, a.val)
+    left, right = a.left, a.right
+    return join(union(left, l), a, union(right, r))
+
+def intersection(a, b):
+    if a is None or b is None:
+        return None
+
+    l, found, r = split(b, a.val)
+    left, right = a.left, a.right
+    left, right = intersection(left, l), intersection(right, r)
+
+    if found:
+        return join(left, a, right)
+    return concat(left, right)
+
+def rangeExtract(root, lo, hi):
+    left, found, rest = split(root, lo)
+    if found:
+        rest = joinKey(None, lo, rest)
+
+    mid, found, right = split(rest, hi)
+    if found:
+        mid = joinKey(mid, hi, None)
+
+    return left, mid, right
+
+class ArrayAVL:
+    def __init__(self):
+        self.key = [0]
+        self.left = [0]
+        self.right = [0]
+        self.height = [0]
+        self.size = [0]
+        self.cnt = [0]
+        self.free = []
+        self.root = 0
+
+    def __len__(self):
+        return self.size[self.root]
+
+    def build(self, keys):
+        self.__init__()
+
+        for x in keys:
+            if len(self.key) > 1 and self.key[-1] == x:
+                self.cnt[-1] += 1
+            else:
+                self.key.append(x)
+                self.cnt.append(1)
+
+        n = len(self.key) - 1
+        self.left += [0] * n
+        self.right += [0] * n
+        self.height += [0] * n
+        self.size += [0] * n
+
+        def go(lo, hi):
+            if lo > hi:
+                return 0
+            mid = (lo + hi) // 2
+            self.left[mid] = go(lo, mid - 1)
+            self.right[mid] = go(mid + 1, hi)
+            self.pull(mid)
+            return mid
+
+        self.root = go(1, n)
+
+    def newNode(self, key):
+        if self.free:
+            i = self.free.pop()
+            self.key[i] = key
+            self.left[i] = self.right[i] = 0
+            self.height[i] = self.size[i] = self.cnt[i] = 1
+            return i
+
+        self.key.append(key)
+        self.left.append(0)
+        self.right.append(0)
+        self.height.append(1)
+        self.size.append(1)
+        self.cnt.append(1)
+        return len(self.key) - 1
+
+    def pull(self, i):
+        l, r = self.left[i], self.right[i]
+        hl, hr = self.height[l], self.height[r]
+        self.height[i] = 1 + (hl if hl > hr else hr)
+        self.size[i] = self.size[l] + self.size[r] + self.cnt[i]
+
+    def rotateRight(self, i):
+        l = self.left[i]
+        self.left[i] = self.right[l]
+        self.right[l] = i
+        self.pull(i)
+        self.pull(l)
+        return l
+
+    def rotateLeft(self, i):
+        r = self.right[i]
+        self.right[i] = self.left[r]
+        self.left[r] = i
+        self.pull(i)
+        self.pull(r)
+        return r
+
+    def rebalance(self, i):
+        self.pull(i)
+        height, left, right = self.height, self.left, self.right
+        balance = height[left[i]] - height[right[i]]
+
+        if balance > 1:
+            l = left[i]
+            if height[left[l]] < height[right[l]]:
+                left[i] = self.rotateLeft(l)
+            return self.rotateRight(i)
+
+        if balance < -1:
+            r = right[i]
+            if height[right[r]] < height[left[r]]:
+                right[i] = self.rotateRight(r)
+            return self.rotateLeft(i)
+
+        return i
+
+    def relink(self, path, dirs, child):
+        height = self.height
+        k = len(path) - 1
+
+        while k >= 0:
+            p = path[k]
+            if dirs[k]:
+                self.right[p] = child
+            else:
+                self.left[p] = child
+
+            h = height[p]
+            child = self.rebalance(p)
+            if child == p and height[p] == h:
+                return
+            k -= 1
+
+        self.root = child
+
+    def insert(self, key):
+        keys, left, right, size = self.key, self.left, self.right, self.size
+        path, dirs = [], []
+        i = self.root
+
+        while i and keys[i] != key:
+            size[i] += 1
+            path.append(i)
+            if key < keys[i]:
+                dirs.append(0)
+                i = left[i]
+            else:
+                dirs.append(1)
+                i = right[i]
+
+        if i:
+            self.cnt[i] += 1
+            size[i] += 1
+            return
+
+        self.relink(path, dirs, self.newNode(key))
+
+    def delete(self, key):
+        keys, left, right, size, cnt = self.key, self.left, self.right, self.size, self.cnt
+        path, dirs = [], []
+        i = self.root
+
+        while i and keys[i] != key:
+            path.append(i)
+            if key < keys[i]:
+                dirs.append(0)
+                i = left[i]
+            else:
+                dirs.append(1)
+                i = right[i]
+
+        if not i:
+            return False
+
+        for p in path:
+            size[p] -= 1
+
+        if cnt[i] > 1:
+            cnt[i] -= 1
+            size[i] -= 1
+            return True
+
+        if left[i] and right[i]:
+            size[i] -= 1
+            path.append(i)
+            dirs.append(1)
+            below = len(path)
+            m = right[i]
+            while left[m]:
+                path.append(m)
+                dirs.append(0)
+                m = left[m]
+            for k in range(below, len(path)):
+                size[path[k]] -= cnt[m]
+            keys[i], cnt[i] = keys[m], cnt[m]
+            i = m
+
+        self.free.append(i)
+        self.relink(path, dirs, left[i] or right[i])
+        return True
+
+    def count(self, key):
+        keys = self.key
+        i = self.root
+        while i and keys[i] != key:
+            i = self.left[i] if key < keys[i] else self.right[i]
+        return self.cnt[i] if i else 0
+
+    def contains(self, key):
+        return self.count(key) > 0
+
+    def countLess(self, key):
+        keys, left, size = self.key, self.left, self.size
+        res = 0
+        i = self.root
+        while i:
+            if keys[i] < key:
+                res += size[i] - size[self.right[i]]
+                i = self.right[i]
+            else:
+                i = left[i]
+        return res
+
+    def countLessEqual(self, key):
+        keys, left, size = self.key, self.left, self.size
+        res = 0
+        i = self.root
+        while i:
+            if keys[i] <= key:
+                res += size[i] - size[self.right[i]]
+                i = self.right[i]
+            else:
+                i = left[i]
+        return res
+
+    def rank(self, key):
+        return self.countLess(key) + 1
+
+    def kth(self, k):
+        if not 0 <= k < self.size[self.root]:
+            return None
+
+        keys, left, right, size, cnt = self.key, self.left, self.right, self.size, self.cnt
+        i = self.root
+        while True:
+            ls = size[left[i]]
+            if k < ls:
+                i = left[i]
+            elif k < ls + cnt[i]:
+                return keys[i]
+            else:
+                k -= ls + cnt[i]
+                i = right[i]
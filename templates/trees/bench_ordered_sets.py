@@ -0,0 +1,54 @@
+import random
+import sys
+import time
+
+import avl
+from avl import ArrayAVL
+from rbt import RBT
+from sorted_list import SortedList
+
+def benchAVL(keys, removals):
+    root = None
+    for x in keys:
+        root = avl.insert(root, x)
+    for x in removals:
+        root = avl.deleteNode(root, x)
+
+def benchArrayAVL(keys, removals):
+    tree = ArrayAVL()
+    for x in keys:
+        tree.insert(x)
+    for x in removals:
+        tree.delete(x)
+
+def benchRBT(keys, removals):
+    tree = RBT()
+    for x in keys:
+        tree.insert(x)
+    for x in removals:
+        tree.deleteNode(tree.findNode(tree.root, x))
+
+def benchSortedList(keys, removals):
+    sl = SortedList()
+    for x in keys:
+        sl.add(x)
+    for x in removals:
+        sl.discard(x)
+
+def run(n, seed=0):
+    rng = random.Random(seed)
+    keys = rng.sample(range(10 * n), n)
+    removals = keys[::2]
+    rng.shuffle(removals)
+
+    print(f"n = {n}: {n} inserts + {len(removals)} deletes")
+    for name, fn in [("avl.insert/deleteNode", benchAVL), ("ArrayAVL", benchArrayAVL),
+                     ("RBT.insert/deleteNode", benchRBT), ("SortedList", benchSortedList)]:
+        start = time.perf_counter()
+        fn(keys, removals)
+        print(f"  {name:<24}{time.perf_counter() - start:8.2f} s")
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(10000)
+    for n in map(int, sys.argv[1:] or ["100000", "1000000"]):
+        run(n)
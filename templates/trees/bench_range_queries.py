@@ -0,0 +1,38 @@
+import random
+import sys
+import time
+
+from merge_sort_tree import MergeSortTree
+from pst import RangeKth
+from wavelet import WaveletMatrix
+
+def run(n, q, seed=0):
+    rng = random.Random(seed)
+    arr = [rng.randrange(10 ** 9) for _ in range(n)]
+    queries = []
+    for _ in range(q):
+        l = rng.randrange(n)
+        r = rng.randrange(l, n)
+        queries.append((l, r, rng.randrange(r - l + 1), rng.randrange(10 ** 9)))
+
+    print(f"n = {n}, q = {q}")
+    for name, cls in [("WaveletMatrix", WaveletMatrix), ("MergeSortTree", MergeSortTree), ("RangeKth (pst)", RangeKth)]:
+        start = time.perf_counter()
+        ds = cls(arr)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for l, r, k, _ in queries:
+            ds.kth(l, r, k)
+        kth = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for l, r, _, x in queries:
+            ds.countLess(l, r, x)
+        count = time.perf_counter() - start
+
+        print(f"  {name:<16}build {build:6.2f} s   kth {kth:6.2f} s   countLess {count:6.2f} s")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2 * 10 ** 5
+    run(n, n // 2)
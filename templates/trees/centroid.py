@@ -0,0 +1,138 @@
+def pairsWithSum(ds, k):
+    cnt = [0] * (min(max(ds, default=0), k) + 1)
+    for d in ds:
+        if d <= k:
+            cnt[d] += 1
+
+    m = len(cnt)
+    res = 0
+    for d in range(max(0, k - m + 1), min(k // 2, m - 1) + 1):
+        e = k - d
+        if d == e:
+            res += cnt[d] * (cnt[d] - 1) // 2
+        else:
+            res += cnt[d] * cnt[e]
+    return res
+
+class CentroidDecomposition:
+    def __init__(self, tree):
+        n = tree.n
+        parent, tstart, child = tree.parent, tree.start, tree.child
+        self.n = n
+
+        start = [0] * (n + 1)
+        for v in range(n):
+            start[v + 1] = start[v] + tstart[v + 1] - tstart[v] + (parent[v] >= 0)
+        adj = [0] * start[n]
+        for v in range(n):
+            i = start[v]
+            k = tstart[v + 1] - tstart[v]
+            adj[i:i + k] = child[tstart[v]:tstart[v + 1]]
+            if parent[v] >= 0:
+                adj[i + k] = parent[v]
+
+        removed = bytearray(n)
+        cparent = [-1] * n
+        clevel = [0] * n
+        members = [None] * n
+        dist = []
+        sub = [0] * n
+        bpar = [-1] * n
+
+        stack = [(r, -1, 0) for r in tree.roots]
+        while stack:
+            r, p, lvl = stack.pop()
+
+            bpar[r] = -1
+            comp = [r]
+            for u in comp:
+                sub[u] = 1
+                for j in range(start[u], start[u + 1]):
+                    w = adj[j]
+                    if w != bpar[u] and not removed[w]:
+                        bpar[w] = u
+                        comp.append(w)
+
+            for u in reversed(comp):
+                if bpar[u] >= 0:
+                    sub[bpar[u]] += sub[u]
+
+            half = len(comp) // 2
+            c = r
+            moved = True
+            while moved:
+                moved = False
+                for j in range(start[c], start[c + 1]):
+                    w = adj[j]
+                    if w != bpar[c] and not removed[w] and sub[w] > half:
+                        c = w
+                        moved = True
+                        break
+
+            cparent[c] = p
+            clevel[c] = lvl
+            if lvl == len(dist):
+                dist.append([0] * n)
+            dl = dist[lvl]
+
+            dl[c] = 0
+            bpar[c] = -1
+            order = [c]
+            for u in order:
+                du = dl[u] + 1
+                for j in range(start[u], start[u + 1]):
+                    w = adj[j]
+                    if w != bpar[u] and not removed[w]:
+                        bpar[w] = u
+                        dl[w] = du
+                        order.append(w)
+
+            members[c] = order
+            removed[c] = 1
+            for j in range(start[c], start[c + 1]):
+                w = adj[j]
+                if not removed[w]:
+                    stack.append((w, c, lvl + 1))
+
+        self.cparent = cparent
+        self.clevel = clevel
+        self.members = members
+        self.dist = dist
+        self.best = [n] * n
+
+    def distances(self, c):
+        dl = self.dist[self.clevel[c]]
+        return [dl[u] for u in self.members[c]]
+
+    def mark(self, v):
+        best, cparent, dist = self.best, self.cparent, self.dist
+        c, l = v, self.clevel[v]
+        while c >= 0:
+            d = dist[l][v]
+            if d < best[c]:
+                best[c] = d
+            c = cparent[c]
+            l -= 1
+
+    def nearest(self, v):
+        best, cparent, dist = self.best, self.cparent, self.dist
+        res = self.n
+        c, l = v, self.clevel[v]
+        while c >= 0:
+            d = best[c] + dist[l][v]
+            if d < res:
+                res = d
+            c = cparent[c]
+            l -= 1
+        return res if res < self.n else -1
+
+    def countPaths(self, k):
+        dist, clevel, members = self.dist, self.clevel, self.members
+        total = 0
+        for c in range(self.n):
+            dl = dist[clevel[c]]
+            total += pairsWithSum([dl[u] for u in members[c]], k)
+            if self.cparent[c] >= 0:
+                dl = dist[clevel[c] - 1]
+                total -= pairsWithSum([dl[u] for u in members[c]], k)
+        return total
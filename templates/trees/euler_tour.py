@@ -0,0 +1,45 @@
+from ft import BIT
+
+def eulerTour(tree):
+    n = tree.n
+    start, child, size = tree.start, tree.child, tree.size
+    tin = [0] * n
+    tout = [0] * n
+    order = [0] * n
+
+    timer = 0
+    stack = tree.roots[::-1]
+    while stack:
+        v = stack.pop()
+        timer += 1
+        tin[v] = timer
+        tout[v] = timer + size[v] - 1
+        order[timer - 1] = v
+        stack.extend(child[start[v]:start[v + 1]])
+
+    return tin, tout, order
+
+class SubtreeSum:
+    def __init__(self, tree, values):
+        self.tin, self.tout, order = eulerTour(tree)
+        self.bit = BIT([values[v] for v in order])
+
+    def add(self, v, delta):
+        self.bit.update(self.tin[v], delta)
+
+    def subtreeSum(self, v):
+        return self.bit.rangeQuery(self.tin[v], self.tout[v])
+
+class SubtreeAdd:
+    def __init__(self, tree, values):
+        self.tin, self.tout, _ = eulerTour(tree)
+        self.values = values
+        self.bit = BIT([0] * tree.n)
+
+    def addSubtree(self, v, delta):
+        self.bit.update(self.tin[v], delta)
+        if self.tout[v] < self.bit.n:
+            self.bit.update(self.tout[v] + 1, -delta)
+
+    def pointQuery(self, v):
+        return self.values[v] + self.bit.query(self.tin[v])
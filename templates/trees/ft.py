@@ -3,10 +3,12 @@ class BIT:
     def __init__(self, nums):
 
         self.n = len(nums)
-        self.bit = [0] * (self.n + 1)
+        self.bit = [0] + list(nums)
 
-        for idx, val in enumerate(nums, 1):
-            self.update(idx, val)
+        for idx in range(1, self.n + 1):
+            parent = idx + (idx & (-idx))
+            if parent <= self.n:
+                self.bit[parent] += self.bit[idx]
 
     def update(self, idx, val):
 
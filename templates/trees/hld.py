@@ -0,0 +1,101 @@
+class HLD:
+    def __init__(self, tree):
+        n = tree.n
+        start, child = tree.start, tree.child
+        size = tree.size
+        self.n = n
+        self.parent = tree.parent
+        self.depth = tree.depth
+        self.size = size
+
+        heavy = [-1] * n
+        for v in range(n):
+            best = 0
+            for j in range(start[v], start[v + 1]):
+                c = child[j]
+                if size[c] > best:
+                    best = size[c]
+                    heavy[v] = c
+
+        head = [0] * n
+        pos = [0] * n
+        order = [0] * n
+        rootOf = [0] * n
+        cur = 0
+        stack = tree.roots[::-1]
+        while stack:
+            h = stack.pop()
+            r = h if self.parent[h] < 0 else rootOf[self.parent[h]]
+            v = h
+            while v != -1:
+                head[v] = h
+                rootOf[v] = r
+                pos[v] = cur
+                order[cur] = v
+                cur += 1
+                for j in range(start[v], start[v + 1]):
+                    if child[j] != heavy[v]:
+                        stack.append(child[j])
+                v = heavy[v]
+
+        self.heavy = heavy
+        self.head = head
+        self.pos = pos
+        self.order = order
+        self.rootOf = rootOf
+
+    def linearize(self, values):
+        return [values[v] for v in self.order]
+
+    def lca(self, u, v):
+        if self.rootOf[u] != self.rootOf[v]:
+            return -1
+
+        head, parent, depth = self.head, self.parent, self.depth
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            u = parent[head[u]]
+        return u if depth[u] < depth[v] else v
+
+    def pathRanges(self, u, v, edge=False):
+        if self.rootOf[u] != self.rootOf[v]:
+            return []
+
+        head, parent, depth, pos = self.head, self.parent, self.depth, self.pos
+        res = []
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            res.append((pos[head[u]], pos[u]))
+            u = parent[head[u]]
+
+        if depth[u] > depth[v]:
+            u, v = v, u
+        if not edge:
+            res.append((pos[u], pos[v]))
+        elif u != v:
+            res.append((pos[u] + 1, pos[v]))
+        return res
+
+    def subtreeRange(self, v, edge=False):
+        return self.pos[v] + edge, self.pos[v] + self.size[v] - 1
+
+    def queryPath(self, u, v, query, combine, identity, edge=False):
+        res = identity
+        for l, r in self.pathRanges(u, v, edge):
+            res = combine(res, query(l, r))
+        return res
+
+    def updatePath(self, u, v, update, edge=False):
+        for l, r in self.pathRanges(u, v, edge):
+            update(l, r)
+
+    def querySubtree(self, v, query, identity, edge=False):
+        l, r = self.subtreeRange(v, edge)
+        return query(l, r) if l <= r else identity
+
+    def updateSubtree(self, v, update, edge=False):
+        l, r = self.subtreeRange(v, edge)
+        if l <= r:
+            update(l, r)
@@ -0,0 +1,148 @@
+class BinaryLifting:
+    def __init__(self, tree):
+        n = tree.n
+        self.n = n
+        self.depth = tree.depth
+        self.log = max(1, max(tree.depth, default=0).bit_length())
+
+        row = [p if p >= 0 else v for v, p in enumerate(tree.parent)]
+        jump = row[:]
+        for _ in range(1, self.log):
+            row = [row[x] for x in row]
+            jump += row
+        self.jump = jump
+
+    def kthAncestor(self, v, k):
+        if k > self.depth[v]:
+            return -1
+        jump, n = self.jump, self.n
+        i = 0
+        while k:
+            if k & 1:
+                v = jump[i * n + v]
+            k >>= 1
+            i += 1
+        return v
+
+    def lca(self, u, v):
+        jump, n, depth = self.jump, self.n, self.depth
+        if depth[u] < depth[v]:
+            u, v = v, u
+
+        diff = depth[u] - depth[v]
+        i = 0
+        while diff:
+            if diff & 1:
+                u = jump[i * n + u]
+            diff >>= 1
+            i += 1
+
+        if u == v:
+            return u
+
+        for base in range((depth[u].bit_length() - 1) * n, -1, -n):
+            if jump[base + u] != jump[base + v]:
+                u = jump[base + u]
+                v = jump[base + v]
+
+        if jump[u] == u:
+            return -1
+        return jump[u]
+
+    def distance(self, u, v):
+        w = self.lca(u, v)
+        return -1 if w < 0 else self.depth[u] + self.depth[v] - 2 * self.depth[w]
+
+    def lcaMany(self, queries):
+        jump, n, depth = self.jump, self.n, self.depth
+        res = []
+        for u, v in queries:
+            if depth[u] < depth[v]:
+                u, v = v, u
+            diff = depth[u] - depth[v]
+            base = 0
+            while diff:
+                if diff & 1:
+                    u = jump[base + u]
+                diff >>= 1
+                base += n
+
+            if u != v:
+                for base in range((depth[u].bit_length() - 1) * n, -1, -n):
+                    a, b = jump[base + u], jump[base + v]
+                    if a != b:
+                        u, v = a, b
+                u = jump[u] if jump[u] != u else -1
+            res.append(u)
+        return res
+
+    def distanceMany(self, queries):
+        depth = self.depth
+        return [-1 if w < 0 else depth[u] + depth[v] - 2 * depth[w]
+                for (u, v), w in zip(queries, self.lcaMany(queries))]
+
+class EulerTourLCA:
+    def __init__(self, tree):
+        n = tree.n
+        start, child, parent = tree.start, tree.child, tree.parent
+        self.depth = tree.depth
+
+        order = []
+        tin = [0] * n
+        stack = tree.roots[::-1]
+        while stack:
+            v = stack.pop()
+            tin[v] = len(order)
+            order.append(v)
+            stack.extend(child[start[v]:start[v + 1]])
+
+        self.order = order
+        self.tin = tin
+
+        row = [tin[parent[v]] if parent[v] >= 0 else -1 for v in order]
+        table = [row]
+        h = 1
+        while 2 * h <= n:
+            row = list(map(min, row[:-h], row[h:]))
+            table.append(row)
+            h *= 2
+        self.table = table
+
+    def lca(self, u, v):
+        if u == v:
+            return u
+        l, r = self.tin[u], self.tin[v]
+        if l > r:
+            l, r = r, l
+        l += 1
+        k = (r - l + 1).bit_length() - 1
+        row = self.table[k]
+        m = min(row[l], row[r - (1 << k) + 1])
+        return self.order[m] if m >= 0 else -1
+
+    def distance(self, u, v):
+        w = self.lca(u, v)
+        return -1 if w < 0 else self.depth[u] + self.depth[v] - 2 * self.depth[w]
+
+    def lcaMany(self, queries):
+        tin, table, order = self.tin, self.table, self.order
+        res = []
+        for u, v in queries:
+            if u == v:
+                res.append(u)
+                continue
+            l, r = tin[u], tin[v]
+            if l > r:
+                l, r = r, l
+            l += 1
+            k = (r - l + 1).bit_length() - 1
+            row = table[k]
+            a, b = row[l], row[r - (1 << k) + 1]
+            m = a if a < b else b
+            res.append(order[m] if m >= 0 else -1)
+        return res
+
+    def distanceMany(self, queries):
+        depth = self.depth
+        return [-1 if w < 0 else depth[u] + depth[v] - 2 * depth[w]
+                for (u, v), w in zip(queries, self.lcaMany(queries))]
@@ -0,0 +1,69 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+class MergeSortTree:
+    def __init__(self, arr):
+        n = len(arr)
+        self.n = n
+        self.size = size = 1 << max(0, (n - 1).bit_length())
+
+        pos = sorted(range(n), key=arr.__getitem__)
+        self.sortedVals = [arr[i] for i in pos]
+
+        key = [0] * n
+        for k, i in enumerate(pos):
+            key[i] = k
+
+        tree = [[] for _ in range(2 * size)]
+        for i in range(n):
+            tree[size + i] = [key[i]]
+
+        cnt = [None] * size
+        for node in range(size - 1, 0, -1):
+            merged = sorted(tree[2 * node] + tree[2 * node + 1])
+            span = size >> (node.bit_length() - 1)
+            mid = (node - (1 << (node.bit_length() - 1))) * span + span // 2
+            tree[node] = merged
+            cnt[node] = list(accumulate((pos[k] < mid for k in merged), initial=0))
+
+        self.tree = tree
+        self.cnt = cnt
+
+    def countKeysBelow(self, l, r, t):
+        size, cnt = self.size, self.cnt
+        res = 0
+        stack = [(1, 0, size, t)]
+        while stack:
+            node, lo, hi, p = stack.pop()
+            if p == 0 or hi <= l or r <= lo:
+                continue
+            if l <= lo and hi <= r:
+                res += p
+                continue
+            mid = (lo + hi) // 2
+            pl = cnt[node][p]
+            stack.append((2 * node, lo, mid, pl))
+            stack.append((2 * node + 1, mid, hi, p - pl))
+        return res
+
+    def countLess(self, l, r, x):
+        return self.countKeysBelow(l, r + 1, bisect_left(self.sortedVals, x))
+
+    def countLessEqual(self, l, r, x):
+        return self.countKeysBelow(l, r + 1, bisect_right(self.sortedVals, x))
+
+    def rangeCount(self, l, r, lo, hi):
+        return max(0, self.countLessEqual(l, r, hi) - self.countLess(l, r, lo))
+
+    def kth(self, l, r, k):
+        if not 0 <= k < r - l + 1:
+            return None
+
+        lo, hi = 1, self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.countKeysBelow(l, r + 1, mid) > k:
+                hi = mid
+            else:
+                lo = mid + 1
+        return self.sortedVals[lo - 1]
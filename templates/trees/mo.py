@@ -0,0 +1,117 @@
+def hilbert(x, y, n):
+    d = 0
+    s = n >> 1
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        if not ry:
+            if rx:
+                x = n - 1 - x
+                y = n - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+def moOrder(n, queries, order="hilbert"):
+    if order == "hilbert":
+        side = 1 << max(1, (n - 1).bit_length())
+        keys = [hilbert(l, r, side) for l, r in queries]
+    else:
+        block = max(1, int(n / max(1, len(queries)) ** 0.5))
+        keys = [(l // block, r if l // block % 2 == 0 else -r) for l, r in queries]
+    return sorted(range(len(queries)), key=keys.__getitem__)
+
+def mo(n, queries, add, remove, answer, order="hilbert"):
+    res = [None] * len(queries)
+    curL, curR = 0, -1
+
+    for qi in moOrder(n, queries, order):
+        l, r = queries[qi]
+        for i in range(curL - 1, l - 1, -1):
+            add(i)
+        for i in range(curR + 1, r + 1):
+            add(i)
+        for i in range(curL, l):
+            remove(i)
+        for i in range(curR, r, -1):
+            remove(i)
+        curL, curR = l, r
+        res[qi] = answer()
+
+    return res
+
+def distinctCounts(arr, queries, order="hilbert"):
+    index = {}
+    vals = [index.setdefault(x, len(index)) for x in arr]
+    cnt = [0] * len(index)
+    distinct = 0
+    res = [0] * len(queries)
+    curL, curR = 0, -1
+
+    for qi in moOrder(len(arr), queries, order):
+        l, r = queries[qi]
+        for x in vals[l:curL]:
+            if cnt[x] == 0:
+                distinct += 1
+            cnt[x] += 1
+        if r > curR:
+            for x in vals[curR + 1:r + 1]:
+                if cnt[x] == 0:
+                    distinct += 1
+                cnt[x] += 1
+        for x in vals[curL:l]:
+            cnt[x] -= 1
+            if cnt[x] == 0:
+                distinct -= 1
+        if r < curR:
+            for x in vals[r + 1:curR + 1]:
+                cnt[x] -= 1
+                if cnt[x] == 0:
+                    distinct -= 1
+        curL, curR = l, r
+        res[qi] = distinct
+
+    return res
+
+def moWithUpdates(arr, queries, updates, add, remove, answer):
+    arr = list(arr)
+    updates = [list(u) for u in updates]
+    n = len(arr)
+    block = max(1, int(round(n ** (2 / 3))))
+    qorder = sorted(range(len(queries)), key=lambda qi: (queries[qi][0] // block, queries[qi][1] // block, queries[qi][2]))
+
+    res = [None] * len(queries)
+    curL, curR, t = 0, -1, 0
+
+    def apply(k):
+        pos = updates[k][0]
+        if curL <= pos <= curR:
+            remove(arr[pos])
+            arr[pos], updates[k][1] = updates[k][1], arr[pos]
+            add(arr[pos])
+        else:
+            arr[pos], updates[k][1] = updates[k][1], arr[pos]
+
+    for qi in qorder:
+        l, r, qt = queries[qi]
+        for i in range(curL - 1, l - 1, -1):
+            add(arr[i])
+        for i in range(curR + 1, r + 1):
+            add(arr[i])
+        for i in range(curL, l):
+            remove(arr[i])
+        for i in range(curR, r, -1):
+            remove(arr[i])
+        curL, curR = l, r
+
+        while t < qt:
+            apply(t)
+            t += 1
+        while t > qt:
+            t -= 1
+            apply(t)
+
+        res[qi] = answer()
+
+    return res
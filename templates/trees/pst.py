@@ -0,0 +1,147 @@
+from bisect import bisect_left
+
+class PersistentSegmentTree:
+    def __init__(self, n, arr=None, mode="sum", updates=0):
+        self.n = n
+        self.mode = mode
+        if mode == "sum":
+            self.identity = 0
+        elif mode == "min":
+            self.identity = float("inf")
+        else:
+            self.identity = float("-inf")
+
+        height = (n - 1).bit_length()
+        capacity = 1 + (2 * n if arr is not None else 0) + updates * (height + 1)
+        self.left = [0] * capacity
+        self.right = [0] * capacity
+        self.value = [self.identity] * capacity
+        self.cnt = 1
+
+        self.arr = arr
+        root = self.build(0, n - 1) if arr is not None and n else 0
+        self.arr = None
+        self.roots = [root]
+
+    def combine(self, a, b):
+        if self.mode == "sum":
+            return a + b
+        return min(a, b) if self.mode == "min" else max(a, b)
+
+    def reserve(self, k):
+        if self.cnt + k > len(self.left):
+            grow = max(k, len(self.left))
+            self.left += [0] * grow
+            self.right += [0] * grow
+            self.value += [self.identity] * grow
+
+    def newNode(self, left, right, value):
+        self.reserve(1)
+        i = self.cnt
+        self.left[i] = left
+        self.right[i] = right
+        self.value[i] = value
+        self.cnt += 1
+        return i
+
+    def build(self, l, r):
+        if l == r:
+            return self.newNode(0, 0, self.arr[l])
+
+        mid = (l + r) // 2
+        a = self.build(l, mid)
+        b = self.build(mid + 1, r)
+        return self.newNode(a, b, self.combine(self.value[a], self.value[b]))
+
+    def update(self, version, pos, val, add=False):
+        left, right, value = self.left, self.right, self.value
+        node = self.roots[version]
+        l, r = 0, self.n - 1
+        path = []
+
+        while l < r:
+            mid = (l + r) // 2
+            if pos <= mid:
+                path.append((node, 0))
+                node = left[node]
+                r = mid
+            else:
+                path.append((node, 1))
+                node = right[node]
+                l = mid + 1
+
+        self.reserve(len(path) + 1)
+        left, right, value = self.left, self.right, self.value
+        combine = self.combine
+        cur = self.cnt
+        value[cur] = value[node] + val if add else val
+
+        for node, went in reversed(path):
+            i = cur + 1
+            if went:
+                sibling = left[node]
+                left[i], right[i] = sibling, cur
+                value[i] = combine(value[sibling], value[cur])
+            else:
+                sibling = right[node]
+                left[i], right[i] = cur, sibling
+                value[i] = combine(value[cur], value[sibling])
+            cur = i
+
+        self.cnt = cur + 1
+        self.roots.append(cur)
+        return len(self.roots) - 1
+
+    def query(self, version, ql, qr):
+        left, right, value = self.left, self.right, self.value
+        res = self.identity
+        stack = [(self.roots[version], 0, self.n - 1)]
+
+        while stack:
+            node, l, r = stack.pop()
+            if qr < l or r < ql or node == 0:
+                continue
+            if ql <= l and r <= qr:
+                res = self.combine(res, value[node])
+                continue
+            mid = (l + r) // 2
+            stack.append((right[node], mid + 1, r))
+            stack.append((left[node], l, mid))
+
+        return res
+
+    def kth(self, va, vb, k):
+        left, right, value = self.left, self.right, self.value
+        a, b = self.roots[va], self.roots[vb]
+        l, r = 0, self.n - 1
+
+        while l < r:
+            mid = (l + r) // 2
+            c = value[left[b]] - value[left[a]]
+            if k < c:
+                a, b = left[a], left[b]
+                r = mid
+            else:
+                k -= c
+                a, b = right[a], right[b]
+                l = mid + 1
+
+        return l
+
+class RangeKth:
+    def __init__(self, arr):
+        self.vals = sorted(set(arr))
+        self.tree = PersistentSegmentTree(len(self.vals), updates=len(arr))
+        for i, x in enumerate(arr):
+            self.tree.update(i, bisect_left(self.vals, x), 1, add=True)
+
+    def kth(self, l, r, k):
+        if not 0 <= k < r - l + 1:
+            return None
+        return self.vals[self.tree.kth(l, r + 1, k)]
+
+    def countLess(self, l, r, x):
+        hi = bisect_left(self.vals, x) - 1
+        if hi < 0:
+            return 0
+        return self.tree.query(r + 1, 0, hi) - self.tree.query(l, 0, hi)
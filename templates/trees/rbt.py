@@ -1,31 +1,34 @@
 class COLOR:
-    RED = "RED"
-    BLACK = "BLACK"
+    RED = 1
+    BLACK = 0
 
 class Node:
+    __slots__ = ("val", "left", "right", "parent", "color", "size")
+
     def __init__(self, key):
         self.val = key
         self.left = None
         self.right = None
         self.parent = None
         self.color = COLOR.RED
+        self.size = 1
 
     def isOnLeft(self):
-        return self.parent is not None and self.parent.left == self
+        return self.parent is not None and self.parent.left is self
+
 
-    
     def hasRedChild(self):
         return (self.left and self.left.color == COLOR.RED) or (self.right and self.right.color == COLOR.RED)
-    
+
     def sibling(self):
         if self.parent is None:
             return None
-        
+
         if self.isOnLeft():
             return self.parent.right
         else:
             return self.parent.left
-        
+
     def uncle(self):
         if self.parent is None or self.parent.parent is None:
             return None
@@ -34,7 +37,7 @@ class Node:
             return self.parent.parent.right
         else:
             return self.parent.parent.left
-        
+
     def moveDown(self, newParent):
         if self.parent is not None:
             if self.isOnLeft():
@@ -45,10 +48,25 @@ class Node:
         newParent.parent = self.parent
         self.parent = newParent
 
+def size(node):
+    return node.size if node else 0
+
 class RBT:
     def __init__(self):
         self.root = None
 
+    def __len__(self):
+        return size(self.root)
+
+    def __iter__(self):
+        node = self.root
+        while node and node.left:
+            node = node.left
+
+        while node:
+            yield node.val
+            node = self.nextNode(node)
+
     def leftRotate(self, node):
         newParent = node.right
         node.moveDown(newParent)
@@ -58,8 +76,10 @@ class RBT:
             newParent.left.parent = node
 
         newParent.left = node
-        
-        if node == self.root:
+        newParent.size = node.size
+        node.size = 1 + size(node.left) + size(node.right)
+
+        if node is self.root:
             self.root = newParent
 
     def rightRotate(self, node):
@@ -71,46 +91,43 @@ class RBT:
             newParent.right.parent = node
 
         newParent.right = node
-        
-        if node == self.root:
+        newParent.size = node.size
+        node.size = 1 + size(node.left) + size(node.right)
+
+        if node is self.root:
             self.root = newParent
 
-    def insertHelper(self, root, key):
-        if root is None:
-            return Node(key)
-
-        if key < root.val:
-            root.left = self.insertHelper(root.left, key)
-            root.left.parent = root
-        elif key > root.val:
-            root.right = self.insertHelper(root.right, key)
-            root.right.parent = root
-        elif key == root.val:
-            return root
-        
-        return root
-    
     def findNode(self, root, key):
-        if root is None or root.val == key:
-            return root
-        if key < root.val:
-            return self.findNode(root.left, key)
-        return self.findNode(root.right, key)
+        while root is not None and root.val != key:
+            root = root.left if key < root.val else root.right
+        return root
 
     def insert(self, key):
-        if self.root is None:
-            self.root = Node(key)
-            self.root.color = COLOR.BLACK
-            return
-        
-        self.root = self.insertHelper(self.root, key)
-        
-        newNode = self.findNode(self.root, key)
-        if newNode:
-            self.fixRedRed(newNode)
-        
-        while self.root.parent:
-            self.root = self.root.parent
+        parent = None
+        node = self.root
+
+        while node is not None:
+            if key == node.val:
+                while parent is not None:
+                    parent.size -= 1
+                    parent = parent.parent
+                return node
+            node.size += 1
+            parent = node
+            node = node.left if key < node.val else node.right
+
+        node = Node(key)
+        node.parent = parent
+
+        if parent is None:
+            self.root = node
+        elif key < parent.val:
+            parent.left = node
+        else:
+            parent.right = node
+
+        self.fixRedRed(node)
+        return node
 
 
     def swapColors(self, node1, node2):
@@ -119,23 +136,25 @@ class RBT:
 
 
     def fixRedRed(self, node):
-        if node == self.root:
-            node.color = COLOR.BLACK
-            return
+        while True:
+            if node is self.root:
+                node.color = COLOR.BLACK
+                return True
+
+            parent = node.parent
+            if parent.color == COLOR.BLACK:
+                return False
+
+            grandparent = parent.parent
+            uncle = node.uncle()
+
+            if uncle and uncle.color == COLOR.RED:
+                parent.color = COLOR.BLACK
+                uncle.color = COLOR.BLACK
+                grandparent.color = COLOR.RED
+                node = grandparent
+                continue
 
-        parent = node.parent
-        if parent.color == COLOR.BLACK:
-            return
-            
-        grandparent = parent.parent
-        uncle = node.uncle()
-        
-        if uncle and uncle.color == COLOR.RED:
-            parent.color = COLOR.BLACK
-            uncle.color = COLOR.BLACK
-            grandparent.color = COLOR.RED
-            self.fixRedRed(grandparent)
-        else:
             if parent.isOnLeft():
                 if node.isOnLeft():
                     self.swapColors(parent, grandparent)
@@ -152,75 +171,61 @@ class RBT:
                 else:
                     self.swapColors(parent, grandparent)
                     self.leftRotate(grandparent)
+            return False
 
     def successor(self, node):
         temp = node
         while temp.left:
             temp = temp.left
         return temp
-    
-    def BSTReplace(self, node):
-        if node.left and node.right:
+
+    def nextNode(self, node):
+        if node.right:
             return self.successor(node.right)
 
-        if not node.left and not node.right:
-            return None
+        while node.parent and not node.isOnLeft():
+            node = node.parent
+        return node.parent
 
-        if node.left:
-            return node.left
-        else:
-            return node.right
-        
     def deleteNode(self, node):
-        replaceNode = self.BSTReplace(node)
-        
-        nodeColor = node.color
-        
-        if node == self.root and replaceNode is None:
-            self.root = None
-            return node
-            
-        if replaceNode:
-            if node.left and node.right:
-                node.val = replaceNode.val
-                return self.deleteNode(replaceNode)
-            else:
-                if node.parent:
-                    if node.isOnLeft():
-                        node.parent.left = replaceNode
-                    else:
-                        node.parent.right = replaceNode
-                    replaceNode.parent = node.parent
-                else:
-                    self.root = replaceNode
-                    replaceNode.parent = None
+        while node.left and node.right:
+            replaceNode = self.successor(node.right)
+            node.val = replaceNode.val
+            node = replaceNode
+
+        replaceNode = node.left or node.right
+
+        if replaceNode is None and node.color == COLOR.BLACK:
+            self.fixBlackBlack(node)
+
+        parent = node.parent
+        if parent is None:
+            self.root = replaceNode
+        elif node.isOnLeft():
+            parent.left = replaceNode
         else:
-            if node.parent:
-                if node.isOnLeft():
-                    node.parent.left = None
-                else:
-                    node.parent.right = None
-            else:
-                self.root = None
+            parent.right = replaceNode
+
+        if replaceNode:
+            replaceNode.parent = parent
+            replaceNode.color = COLOR.BLACK
 
-        if nodeColor == COLOR.BLACK:
-            if replaceNode and replaceNode.color == COLOR.RED:
-                replaceNode.color = COLOR.BLACK
-            elif replaceNode is not None:
-                self.fixBlackBlack(replaceNode)
+        while parent is not None:
+            parent.size -= 1
+            parent = parent.parent
 
+        node.parent = node.left = node.right = None
         return node
-    
+
     def fixBlackBlack(self, node):
-        if node == self.root or node is None:
-            return
+        while node is not self.root:
+            sibling = node.sibling()
+            parent = node.parent
 
-        sibling = node.sibling()
-        parent = node.parent
+            if sibling is None:
+                node = parent
+                continue
 
-        if sibling is None:
-            self.fixBlackBlack(parent)
-        else:
             if sibling.color == COLOR.RED:
                 parent.color = COLOR.RED
                 sibling.color = COLOR.BLACK
@@ -228,31 +233,278 @@ class RBT:
                     self.rightRotate(parent)
                 else:
                     self.leftRotate(parent)
-                self.fixBlackBlack(node)
-            else:
-                if sibling.hasRedChild():
-                    if sibling.left and sibling.left.color == COLOR.RED:
-                        if sibling.isOnLeft():
-                            sibling.left.color = sibling.color
-                            sibling.color = parent.color
-                            self.rightRotate(parent)
-                        else:
-                            sibling.left.color = parent.color
-                            self.rightRotate(sibling)
-                            self.leftRotate(parent)
+                continue
+
+            if sibling.hasRedChild():
+                if sibling.left and sibling.left.color == COLOR.RED:
+                    if sibling.isOnLeft():
+                        sibling.left.color = sibling.color
+                        sibling.color = parent.color
+                        self.rightRotate(parent)
                     else:
-                        if sibling.isOnLeft():
-                            sibling.right.color = parent.color
-                            self.leftRotate(sibling)
-                            self.rightRotate(parent)
-                        else:
-                            sibling.right.color = sibling.color
-                            sibling.color = parent.color
-                            self.leftRotate(parent)
-                    parent.color = COLOR.BLACK
+                        sibling.left.color = parent.color
+                        self.rightRotate(sibling)
+                        self.leftRotate(parent)
                 else:
-                    sibling.color = COLOR.RED
-                    if parent.color == COLOR.BLACK:
-                        self.fixBlackBlack(parent)
+                    if sibling.isOnLeft():
+                        sibling.right.color = parent.color
+                        self.leftRotate(sibling)
+                        self.rightRotate(parent)
                     else:
-                        parent.color = COLOR.BLACK
\ No newline at end of file
+                        sibling.right.color = sibling.color
+                        sibling.color = parent.color
+                        self.leftRotate(parent)
+                parent.color = COLOR.BLACK
+                return
+
+            sibling.color = COLOR.RED
+            if parent.color == COLOR.BLACK:
+                node = parent
+            else:
+                parent.color = COLOR.BLACK
+                return
+
+    def lowerBound(self, key):
+        res = None
+        node = self.root
+        while node:
+            if node.val >= key:
+                res = node
+                node = node.left
+            else:
+                node = node.right
+        return res
+
+    def upperBound(self, key):
+        res = None
+        node = self.root
+        while node:
+            if node.val > key:
+                res = node
+                node = node.left
+            else:
+                node = node.right
+        return res
+
+    def countLess(self, key):
+        res = 0
+        node = self.root
+        while node:
+            if node.val < key:
+                res += 1 + size(node.left)
+                node = node.right
+            else:
+                node = node.left
+        return res
+
+    def countLessEqual(self, key):
+        res = 0
+        node = self.root
+        while node:
+            if node.val <= key:
+                res += 1 + size(node.left)
+                node = node.right
+            else:
+                node = node.left
+        return res
+
+    def rangeCount(self, lo, hi):
+        return max(0, self.countLessEqual(hi) - self.countLess(lo))
+
+    def iterRange(self, lo, hi):
+        node = self.lowerBound(lo)
+        while node and node.val <= hi:
+            yield node.val
+            node = self.nextNode(node)
+
+    def build(self, keys):
+        n = len(keys)
+        deepest = n.bit_length() - 1
+
+        def go(lo, hi, depth, parent):
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = Node(keys[mid])
+            node.parent = parent
+            node.size = hi - lo + 1
+            if depth < deepest or depth == 0:
+                node.color = COLOR.BLACK
+            node.left = go(lo, mid - 1, depth + 1, node)
+            node.right = go(mid + 1, hi, depth + 1, node)
+            return node
+
+        self.root = go(0, n - 1, 0, None)
+        return self
+
+    def join(self, key, other):
+        self.root, _ = joinNodes(self.root, blackHeight(self.root), Node(key), other.root, blackHeight(other.root))
+        other.root = None
+        return self
+
+    def split(self, key):
+        left, _, found, right, _ = splitNode(self.root, blackHeight(self.root), key)
+        self.root = None
+        return fromRoot(left), found, fromRoot(right)
+
+    def union(self, other):
+        root, _ = unionNodes(self.root, blackHeight(self.root), other.root, blackHeight(other.root))
+        self.root = fromRoot(root).root
+        other.root = None
+        return self
+
+    def intersection(self, other):
+        root, _ = intersectionNodes(self.root, blackHeight(self.root), other.root, blackHeight(other.root))
+        self.root = fromRoot(root).root
+        other.root = None
+        return self
+
+    def rangeExtract(self, lo, hi):
+        left, found, rest = self.split(lo)
+        if found:
+            rest = RBT().join(lo, rest)
+
+        mid, found, right = rest.split(hi)
+        if found:
+            mid.join(hi, RBT())
+
+        return left, mid, right
+
+def pull(node):
+    node.size = 1 + size(node.left) + size(node.right)
+
+def blackHeight(node):
+    bh = 0
+    while node:
+        if node.color == COLOR.BLACK:
+            bh += 1
+        node = node.left
+    return bh
+
+def fromRoot(root):
+    tree = RBT()
+    if root:
+        root.parent = None
+        root.color = COLOR.BLACK
+    tree.root = root
+    return tree
+
+def detach(node):
+    left, right = node.left, node.right
+    if left:
+        left.parent = None
+    if right:
+        right.parent = None
+    node.left = node.right = None
+    return left, right
+
+def joinNodes(left, lbh, mid, right, rbh):
+    if left and left.color == COLOR.RED:
+        left.color = COLOR.BLACK
+        lbh += 1
+    if right and right.color == COLOR.RED:
+        right.color = COLOR.BLACK
+        rbh += 1
+
+    mid.parent = None
+    if lbh == rbh:
+        mid.left, mid.right = left, right
+        if left:
+            left.parent = mid
+        if right:
+            right.parent = mid
+        mid.color = COLOR.BLACK
+        pull(mid)
+        return mid, lbh + 1
+
+    tree = RBT()
+    mid.color = COLOR.RED
+
+    if lbh > rbh:
+        tree.root, bh, other = left, lbh, right
+        parent, node, h = None, left, lbh
+        while node and (node.color == COLOR.RED or h > rbh):
+            if node.color == COLOR.BLACK:
+                h -= 1
+            parent, node = node, node.right
+        mid.left, mid.right = node, right
+        parent.right = mid
+    else:
+        tree.root, bh, other = right, rbh, left
+        parent, node, h = None, right, rbh
+        while node and (node.color == COLOR.RED or h > lbh):
+            if node.color == COLOR.BLACK:
+                h -= 1
+            parent, node = node, node.left
+        mid.left, mid.right = left, node
+        parent.left = mid
+
+    mid.parent = parent
+    if node:
+        node.parent = mid
+    if other:
+        other.parent = mid
+    pull(mid)
+
+    delta = size(other) + 1
+    while parent:
+        parent.size += delta
+        parent = parent.parent
+
+    if tree.fixRedRed(mid):
+        bh += 1
+    return tree.root, bh
+
+def splitNode(root, bh, key):
+    if root is None:
+        return None, 0, False, None, 0
+
+    left, right = detach(root)
+    bh -= root.color == COLOR.BLACK
+
+    if key == root.val:
+        return left, bh, True, right, bh
+
+    if key < root.val:
+        l, lbh, found, r, rbh = splitNode(left, bh, key)
+        r, rbh = joinNodes(r, rbh, root, right, bh)
+    else:
+        l, lbh, found, r, rbh = splitNode(right, bh, key)
+        l, lbh = joinNodes(left, bh, root, l, lbh)
+    return l, lbh, found, r, rbh
+
+def concatNodes(left, lbh, right, rbh):
+    if right is None:
+        return left, lbh
+
+    tree = fromRoot(right)
+    mid = tree.deleteNode(tree.successor(right))
+    return joinNodes(left, lbh, mid, tree.root, blackHeight(tree.root))
+
+def unionNodes(a, abh, b, bbh):
+    if a is None:
+        return b, bbh
+    if b is None:
+        return a, abh
+
+    left, right = detach(a)
+    abh -= a.color == COLOR.BLACK
+
+    l, lbh, _, r, rbh = splitNode(b, bbh, a.val)
+    l, lbh = unionNodes(left, abh, l, lbh)
+    r, rbh = unionNodes(right, abh, r, rbh)
+    return joinNodes(l, lbh, a, r, rbh)
+
+def intersectionNodes(a, abh, b, bbh):
+    if a is None or b is None:
+        return None, 0
+
+    left, right = detach(a)
+    abh -= a.color == COLOR.BLACK
+
+    l, lbh, found, r, rbh = splitNode(b, bbh, a.val)
+    l, lbh = intersectionNodes(left, abh, l, lbh)
+    r, rbh = intersectionNodes(right, abh, r, rbh)
+    if found:
+        return joinNodes(l, lbh, a, r, rbh)
+    return concatNodes(l, lbh, r, rbh)
@@ -0,0 +1,34 @@
+def reroot(tree, merge, identity, addEdge, addRoot):
+    n = tree.n
+    parent, start, child, order = tree.parent, tree.start, tree.child, tree.order
+
+    down = [identity] * n
+    for v in reversed(order):
+        acc = identity
+        for j in range(start[v], start[v + 1]):
+            c = child[j]
+            acc = merge(acc, addEdge(down[c], c, v))
+        down[v] = addRoot(acc, v)
+
+    up = [identity] * n
+    ans = [identity] * n
+    for v in order:
+        p = parent[v]
+        top = addEdge(up[v], p, v) if p >= 0 else identity
+
+        lo, hi = start[v], start[v + 1]
+        vals = [addEdge(down[child[j]], child[j], v) for j in range(lo, hi)]
+        k = len(vals)
+
+        suffix = [identity] * (k + 1)
+        for i in range(k - 1, -1, -1):
+            suffix[i] = merge(vals[i], suffix[i + 1])
+
+        prefix = top
+        for i in range(k):
+            up[child[lo + i]] = addRoot(merge(prefix, suffix[i + 1]), v)
+            prefix = merge(prefix, vals[i])
+
+        ans[v] = addRoot(prefix, v)
+
+    return ans
@@ -0,0 +1,113 @@
+class RootedTree:
+    def __init__(self, parent):
+        n = len(parent)
+        self.n = n
+        self.parent = parent
+        self.roots = [v for v in range(n) if parent[v] < 0]
+
+        start = [0] * (n + 1)
+        for v in range(n):
+            if parent[v] >= 0:
+                start[parent[v] + 1] += 1
+        for v in range(n):
+            start[v + 1] += start[v]
+
+        child = [0] * start[n]
+        fill = start[:n]
+        for v in range(n):
+            p = parent[v]
+            if p >= 0:
+                child[fill[p]] = v
+                fill[p] += 1
+
+        self.start = start
+        self.child = child
+
+        order = self.roots[:]
+        depth = [0] * n
+        levelStart = [0]
+        i = 0
+        while i < len(order):
+            levelStart.append(len(order))
+            end = len(order)
+            while i < end:
+                v = order[i]
+                d = depth[v] + 1
+                for j in range(start[v], start[v + 1]):
+                    c = child[j]
+                    depth[c] = d
+                    order.append(c)
+                i += 1
+
+        if len(order) != n:
+            raise ValueError("parent array does not describe a forest")
+
+        size = [1] * n
+        for v in reversed(order):
+            p = parent[v]
+            if p >= 0:
+                size[p] += size[v]
+
+        self.order = order
+        self.depth = depth
+        self.size = size
+        self.levelStart = levelStart
+
+    @classmethod
+    def fromParents(cls, parent, offset=0):
+        if offset:
+            parent = [p - offset for p in parent]
+        else:
+            parent = list(parent)
+        return cls(parent)
+
+    @classmethod
+    def fromEdges(cls, n, edges, root=0):
+        if len(edges) != n - 1:
+            raise ValueError("edges do not form a tree")
+
+        start = [0] * (n + 1)
+        for u, v in edges:
+            start[u + 1] += 1
+            start[v + 1] += 1
+        for v in range(n):
+            start[v + 1] += start[v]
+
+        adj = [0] * start[n]
+        fill = start[:n]
+        for u, v in edges:
+            adj[fill[u]] = v
+            fill[u] += 1
+            adj[fill[v]] = u
+            fill[v] += 1
+
+        parent = [-2] * n
+        parent[root] = -1
+        queue = [root]
+        for u in queue:
+            for j in range(start[u], start[u + 1]):
+                v = adj[j]
+                if parent[v] == -2:
+                    parent[v] = u
+                    queue.append(v)
+
+        if len(queue) != n:
+            raise ValueError("edges do not form a tree")
+        return cls(parent)
+
+    def children(self, v):
+        return self.child[self.start[v]:self.start[v + 1]]
+
+    def isLeaf(self, v):
+        return self.start[v] == self.start[v + 1]
+
+    def height(self):
+        return len(self.levelStart) - 2
+
+    def level(self, d):
+        return self.order[self.levelStart[d]:self.levelStart[d + 1]]
+
+    def levels(self):
+        order, bounds = self.order, self.levelStart
+        for d in range(len(bounds) - 1):
+            yield order[bounds[d]:bounds[d + 1]]
@@ -0,0 +1,193 @@
+from bisect import bisect_left, bisect_right, insort
+
+class SortedList:
+    LOAD = 512
+
+    def __init__(self, iterable=()):
+        values = sorted(iterable)
+        self.size = len(values)
+        self.buckets = [values[i:i + self.LOAD] for i in range(0, self.size, self.LOAD)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+        self.fen = None
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+    def __contains__(self, x):
+        return self.count(x) > 0
+
+    def __getitem__(self, k):
+        return self.kth(k)
+
+    def buildIndex(self):
+        fen = [0] + [len(bucket) for bucket in self.buckets]
+        m = len(fen)
+        for i in range(1, m):
+            j = i + (i & -i)
+            if j < m:
+                fen[j] += fen[i]
+        self.fen = fen
+
+    def updateIndex(self, k, delta):
+        if self.fen is None:
+            return
+        fen = self.fen
+        k += 1
+        while k < len(fen):
+            fen[k] += delta
+            k += k & -k
+
+    def prefix(self, k):
+        if self.fen is None:
+            self.buildIndex()
+        fen = self.fen
+        res = 0
+        while k > 0:
+            res += fen[k]
+            k -= k & -k
+        return res
+
+    def locate(self, k):
+        if self.fen is None:
+            self.buildIndex()
+        fen = self.fen
+        m = len(fen)
+        pos = 0
+        step = 1 << (m.bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt < m and fen[nxt] <= k:
+                pos = nxt
+                k -= fen[nxt]
+            step >>= 1
+        return pos, k
+
+    def add(self, x):
+        buckets, maxes = self.buckets, self.maxes
+        self.size += 1
+
+        if not buckets:
+            buckets.append([x])
+            maxes.append(x)
+            self.fen = None
+            return
+
+        k = bisect_left(maxes, x)
+        if k == len(maxes):
+            k -= 1
+
+        bucket = buckets[k]
+        insort(bucket, x)
+        maxes[k] = bucket[-1]
+
+        if len(bucket) > 2 * self.LOAD:
+            buckets[k:k + 1] = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            maxes[k:k + 1] = [bucket[self.LOAD - 1], bucket[-1]]
+            self.fen = None
+        else:
+            self.updateIndex(k, 1)
+
+    def discard(self, x):
+        buckets, maxes = self.buckets, self.maxes
+        k = bisect_left(maxes, x)
+        if k == len(maxes):
+            return False
+
+        bucket = buckets[k]
+        i = bisect_left(bucket, x)
+        if bucket[i] != x:
+            return False
+
+        del bucket[i]
+        self.size -= 1
+
+        if not bucket:
+            del buckets[k]
+            del maxes[k]
+            self.fen = None
+            return True
+
+        maxes[k] = bucket[-1]
+
+        if len(bucket) < self.LOAD // 4 and len(buckets) > 1:
+            j = k - 1 if k else k + 1
+            lo, hi = min(j, k), max(j, k)
+            merged = buckets[lo] + buckets[hi]
+            if len(merged) > 2 * self.LOAD:
+                half = len(merged) // 2
+                buckets[lo:hi + 1] = [merged[:half], merged[half:]]
+                maxes[lo:hi + 1] = [merged[half - 1], merged[-1]]
+            else:
+                buckets[lo:hi + 1] = [merged]
+                maxes[lo:hi + 1] = [merged[-1]]
+            self.fen = None
+        else:
+            self.updateIndex(k, -1)
+
+        return True
+
+    def remove(self, x):
+        if not self.discard(x):
+            raise ValueError(f"{x} not in SortedList")
+
+    def pop(self, k=-1):
+        x = self.kth(k)
+        self.discard(x)
+        return x
+
+    def kth(self, k):
+        if k < 0:
+            k += self.size
+        if not 0 <= k < self.size:
+            raise IndexError("SortedList index out of range")
+        b, i = self.locate(k)
+        return self.buckets[b][i]
+
+    def bisectLeft(self, x):
+        k = bisect_left(self.maxes, x)
+        if k == len(self.maxes):
+            return self.size
+        return self.prefix(k) + bisect_left(self.buckets[k], x)
+
+    def bisectRight(self, x):
+        k = bisect_right(self.maxes, x)
+        if k == len(self.maxes):
+            return self.size
+        return self.prefix(k) + bisect_right(self.buckets[k], x)
+
+    def count(self, x):
+        return self.bisectRight(x) - self.bisectLeft(x)
+
+    def lowerBound(self, x):
+        k = bisect_left(self.maxes, x)
+        if k == len(self.maxes):
+            return None
+        bucket = self.buckets[k]
+        return bucket[bisect_left(bucket, x)]
+
+    def upperBound(self, x):
+        k = bisect_right(self.maxes, x)
+        if k == len(self.maxes):
+            return None
+        bucket = self.buckets[k]
+        return bucket[bisect_right(bucket, x)]
+
+    def iterRange(self, lo, hi):
+        buckets = self.buckets
+        k = bisect_left(self.maxes, lo)
+        if k == len(buckets):
+            return
+        i = bisect_left(buckets[k], lo)
+        while k < len(buckets):
+            bucket = buckets[k]
+            while i < len(bucket):
+                if bucket[i] > hi:
+                    return
+                yield bucket[i]
+                i += 1
+            k += 1
+            i = 0
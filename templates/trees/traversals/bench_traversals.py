@@ -0,0 +1,64 @@
+import random
+import sys
+import time
+
+from dfs import iterInOrder, iterPostOrder, iterPreOrder
+from morris import kthSmallest, morrisInorder, morrisPostorder, morrisPreorder
+
+class Node:
+    __slots__ = ("data", "left", "right")
+
+    def __init__(self, data):
+        self.data = data
+        self.left = None
+        self.right = None
+
+def randomBST(n, rng):
+    keys = list(range(n))
+    rng.shuffle(keys)
+    root = Node(keys[0])
+    for x in keys[1:]:
+        node = root
+        while True:
+            if x < node.data:
+                if node.left is None:
+                    node.left = Node(x)
+                    break
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = Node(x)
+                    break
+                node = node.right
+    return root
+
+def chain(n):
+    root = node = Node(0)
+    for x in range(1, n):
+        node.right = Node(x)
+        node = node.right
+    return root
+
+def consume(gen):
+    total = 0
+    for x in gen:
+        total += x
+    return total
+
+def run(n, seed=0):
+    rng = random.Random(seed)
+    for label, root in [("random BST", randomBST(n, rng)), ("right chain", chain(n))]:
+        print(f"n = {n}, {label}")
+        for name, fn in [("iterPreOrder", iterPreOrder), ("morrisPreorder", morrisPreorder),
+                         ("iterInOrder", iterInOrder), ("morrisInorder", morrisInorder),
+                         ("iterPostOrder", iterPostOrder), ("morrisPostorder", morrisPostorder)]:
+            start = time.perf_counter()
+            consume(fn(root))
+            print(f"  {name:<18}{time.perf_counter() - start:8.2f} s")
+
+        start = time.perf_counter()
+        kthSmallest(root, 10)
+        print(f"  {'kthSmallest(10)':<18}{time.perf_counter() - start:8.4f} s")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5)
@@ -1,8 +1,87 @@
+def iterPreOrder(root):
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node.data
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def iterInOrder(root):
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.data
+        node = node.right
+
+def iterPostOrder(root):
+    stack = []
+    node, last = root, None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right
+        else:
+            yield top.data
+            last = stack.pop()
+
+def fillPreOrder(root, out, i=0):
+    stack = [root] if root else []
+    push, pop = stack.append, stack.pop
+    while stack:
+        node = pop()
+        out[i] = node.data
+        i += 1
+        if node.right:
+            push(node.right)
+        if node.left:
+            push(node.left)
+    return i
+
+def fillInOrder(root, out, i=0):
+    stack = []
+    push, pop = stack.append, stack.pop
+    node = root
+    while stack or node:
+        while node:
+            push(node)
+            node = node.left
+        node = pop()
+        out[i] = node.data
+        i += 1
+        node = node.right
+    return i
+
+def fillPostOrder(root, out, i=0):
+    stack = []
+    push, pop = stack.append, stack.pop
+    node, last = root, None
+    while stack or node:
+        while node:
+            push(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right
+        else:
+            out[i] = top.data
+            i += 1
+            last = pop()
+    return i
+
 def preOrder(root):
-    return [root.data] + preOrder(root.left) + preOrder(root.right) if root else []
+    return list(iterPreOrder(root))
 
 def inOrder(root):
-    return inOrder(root.left) + [root.data] + inOrder(root.right) if root else []
+    return list(iterInOrder(root))
 
 def postOrder(root):
-    return postOrder(root.left) + postOrder(root.right) + [root.data] if root else []
\ No newline at end of file
+    return list(iterPostOrder(root))
@@ -0,0 +1,138 @@
+class Anchor:
+    __slots__ = ("left", "right")
+
+    def __init__(self, left):
+        self.left = left
+        self.right = None
+
+def unthread(cur, threads):
+    while threads:
+        if cur.left:
+            pre = cur.left
+            while pre.right and pre.right is not cur:
+                pre = pre.right
+            if pre.right is cur:
+                pre.right = None
+                threads -= 1
+        cur = cur.right
+
+def reverseRight(node):
+    prev = None
+    while node:
+        node.right, prev, node = prev, node, node.right
+    return prev
+
+def morrisInorder(root):
+    cur = root
+    threads = 0
+    try:
+        while cur:
+            if not cur.left:
+                val = cur.data
+                cur = cur.right
+                yield val
+                continue
+
+            pre = cur.left
+            while pre.right and pre.right is not cur:
+                pre = pre.right
+
+            if not pre.right:
+                pre.right = cur
+                threads += 1
+                cur = cur.left
+            else:
+                pre.right = None
+                threads -= 1
+                val = cur.data
+                cur = cur.right
+                yield val
+    finally:
+        unthread(cur, threads)
+
+def morrisPreorder(root):
+    cur = root
+    threads = 0
+    try:
+        while cur:
+            if not cur.left:
+                val = cur.data
+                cur = cur.right
+                yield val
+                continue
+
+            pre = cur.left
+            while pre.right and pre.right is not cur:
+                pre = pre.right
+
+            if not pre.right:
+                pre.right = cur
+                threads += 1
+                val = cur.data
+                cur = cur.left
+                yield val
+            else:
+                pre.right = None
+                threads -= 1
+                cur = cur.right
+    finally:
+        unthread(cur, threads)
+
+def morrisPostorder(root):
+    cur = Anchor(root)
+    threads = 0
+    head = None
+    try:
+        while cur:
+            if not cur.left:
+                cur = cur.right
+                continue
+
+            pre = cur.left
+            while pre.right and pre.right is not cur:
+                pre = pre.right
+
+            if not pre.right:
+                pre.right = cur
+                threads += 1
+                cur = cur.left
+                continue
+
+            pre.right = None
+            threads -= 1
+            head = reverseRight(cur.left)
+            node = head
+            while node:
+                yield node.data
+                node = node.right
+            reverseRight(head)
+            head = None
+            cur = cur.right
+    finally:
+        if head is not None:
+            reverseRight(head)
+            cur = cur.right
+        unthread(cur, threads)
+
+def kthSmallest(root, k):
+    gen = morrisInorder(root)
+    try:
+        for val in gen:
+            k -= 1
+            if k == 0:
+                return val
+    finally:
+        gen.close()
+    return None
+
+def isValidBST(root):
+    gen = morrisInorder(root)
+    try:
+        prev = None
+        for val in gen:
+            if prev is not None and val <= prev[0]:
+                return False
+            prev = (val,)
+    finally:
+        gen.close()
+    return True
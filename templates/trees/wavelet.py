@@ -0,0 +1,82 @@
+from bisect import bisect_left, bisect_right
+
+class BitVector:
+    def __init__(self, bits):
+        n = len(bits)
+        raw = int("".join(map(str, reversed(bits))) or "0", 2).to_bytes(n // 8 + 8, "little")
+
+        words = [int.from_bytes(raw[i:i + 8], "little") for i in range(0, n // 64 * 8 + 8, 8)]
+        cum = [0] * (len(words) + 1)
+        for i, w in enumerate(words):
+            cum[i + 1] = cum[i] + w.bit_count()
+
+        self.words = words
+        self.cum = cum
+        self.zeros = n - cum[-1]
+
+    def rank1(self, i):
+        return self.cum[i >> 6] + (self.words[i >> 6] & ((1 << (i & 63)) - 1)).bit_count()
+
+    def rank0(self, i):
+        return i - self.rank1(i)
+
+class WaveletMatrix:
+    def __init__(self, arr):
+        self.vals = sorted(set(arr))
+        cur = [bisect_left(self.vals, x) for x in arr]
+        self.n = len(arr)
+        self.log = max(1, (len(self.vals) - 1).bit_length())
+
+        self.levels = []
+        for bit in range(self.log - 1, -1, -1):
+            bits = [x >> bit & 1 for x in cur]
+            self.levels.append(BitVector(bits))
+            cur = [x for x, b in zip(cur, bits) if not b] + [x for x, b in zip(cur, bits) if b]
+
+    def kth(self, l, r, k):
+        if not 0 <= k < r - l + 1:
+            return None
+
+        r += 1
+        res = 0
+        for lv in self.levels:
+            zl, zr = lv.rank0(l), lv.rank0(r)
+            res <<= 1
+            if k < zr - zl:
+                l, r = zl, zr
+            else:
+                k -= zr - zl
+                res |= 1
+                l, r = lv.zeros + l - zl, lv.zeros + r - zr
+
+        return self.vals[res]
+
+    def countBelow(self, l, r, c):
+        if c <= 0:
+            return 0
+        if c >= 1 << self.log:
+            return r - l
+
+        res = 0
+        bit = self.log - 1
+        for lv in self.levels:
+            zl, zr = lv.rank0(l), lv.rank0(r)
+            if c >> bit & 1:
+                res += zr - zl
+                l, r = lv.zeros + l - zl, lv.zeros + r - zr
+            else:
+                l, r = zl, zr
+            bit -= 1
+        return res
+
+    def countLess(self, l, r, x):
+        return self.countBelow(l, r + 1, bisect_left(self.vals, x))
+
+    def countLessEqual(self, l, r, x):
+        return self.countBelow(l, r + 1, bisect_right(self.vals, x))
+
+    def rangeCount(self, l, r, lo, hi):
+        return max(0, self.countLessEqual(l, r, hi) - self.countLess(l, r, lo))
+
+    def frequency(self, l, r, x):
+        return self.rangeCount(l, r, x, x)